@@ -3,6 +3,10 @@ F1 INSIGHT HUB - Configuration & Settings
 Shared settings for team colors, track scales, UI themes, and constants
 """
 
+import functools
+import json
+import sys
+
 import fastf1.plotting
 
 
@@ -61,8 +65,41 @@ DRS_ZONE_COLOR = (100, 255, 100, 80)  # Light green with transparency
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=256)
+def hex_to_rgb(color_hex):
+    """Convert a '#RRGGBB' string to an RGB tuple"""
+    color_hex = color_hex.lstrip("#")
+    return tuple(int(color_hex[i : i + 2], 16) for i in (0, 2, 4))
+
+
+# Resolved colors per (driver, session identity). Keyed on small identifying
+# values rather than the session object, so cached entries never keep a whole
+# session (laps, telemetry) alive
+_DRIVER_COLOR_CACHE = {}
+
+
+def _session_key(session):
+    """Small hashable identity of a loaded session, or None if it can't be read"""
+    if not session:
+        return ()
+    try:
+        return (session.event["EventName"], session.name, str(session.date))
+    except (KeyError, AttributeError, TypeError):
+        return None
+
+
 def get_driver_color(driver_code, session=None):
-    
+    key = _session_key(session)
+    if key is not None:
+        cache_key = (driver_code, key)
+        color = _DRIVER_COLOR_CACHE.get(cache_key)
+        if color is None:
+            color = _DRIVER_COLOR_CACHE[cache_key] = _resolve_driver_color(driver_code, session)
+        return color
+    return _resolve_driver_color(driver_code, session)
+
+
+def _resolve_driver_color(driver_code, session):
     try:
         if session:
             # Get color from session data
@@ -71,10 +108,8 @@ def get_driver_color(driver_code, session=None):
             # Use FastF1's default driver colors
             color_hex = fastf1.plotting.DRIVER_COLORS.get(driver_code, "#FFFFFF")
 
-        # Convert hex to RGB
-        color_hex = color_hex.lstrip("#")
-        return tuple(int(color_hex[i : i + 2], 16) for i in (0, 2, 4))
-    except:
+        return hex_to_rgb(color_hex)
+    except (KeyError, ValueError, AttributeError, TypeError):
         return FALLBACK_DRIVER_COLORS.get(driver_code, (255, 255, 255))
 
 
@@ -140,6 +175,10 @@ TYRE_COLORS = {
 }
 
 
+TYRE_COMPOUNDS_REVERSE = {value: name for name, value in TYRE_COMPOUNDS.items()}
+
+
+@functools.lru_cache(maxsize=32)
 def get_tyre_compound_int(compound_str):
     """Convert tyre compound string to integer code"""
     return TYRE_COMPOUNDS.get(str(compound_str).upper(), -1)
@@ -147,10 +186,7 @@ def get_tyre_compound_int(compound_str):
 
 def get_tyre_compound_str(compound_int):
     """Convert tyre compound integer to string"""
-    for name, value in TYRE_COMPOUNDS.items():
-        if value == compound_int:
-            return name
-    return "UNKNOWN"
+    return TYRE_COMPOUNDS_REVERSE.get(compound_int, "UNKNOWN")
 
 
 def get_tyre_color(compound_str):
@@ -221,16 +257,26 @@ def format_time(seconds):
     """Convert seconds to MM:SS.mmm format"""
     if seconds is None or seconds < 0:
         return "N/A"
-    minutes = int(seconds // 60)
-    secs = seconds % 60
-    return f"{minutes:02d}:{secs:06.3f}"
+    # Labels only show milliseconds, so cache on the millisecond value
+    return _format_time_ms(round(seconds, 3))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time_ms(seconds):
+    minutes, secs = divmod(seconds, 60.0)
+    return f"{int(minutes):02d}:{secs:06.3f}"
 
 
 def format_speed(speed_kmh):
     """Format speed value"""
     if speed_kmh is None:
         return "---"
-    return f"{int(speed_kmh)} km/h"
+    return _format_speed_kmh(int(speed_kmh))
+
+
+@functools.lru_cache(maxsize=512)
+def _format_speed_kmh(speed_kmh):
+    return f"{speed_kmh} km/h"
 
 
 def format_distance(distance_m):
@@ -240,6 +286,21 @@ def format_distance(distance_m):
     return f"{distance_m / 1000:.2f} km"
 
 
+def serve_argv(argv=None):
+    """Command-line arguments for a module started with --serve.
+
+    The launcher pre-starts modules with --serve and later writes the real
+    arguments to stdin as one JSON list. Returns None (use sys.argv) when not
+    serving, and exits quietly if stdin closes before a job arrives.
+    """
+    if "--serve" not in (sys.argv[1:] if argv is None else argv):
+        return argv
+    line = sys.stdin.readline()
+    if not line:
+        sys.exit(0)
+    return json.loads(line)
+
+
 # ============================================================================
 # CIRCUIT-SPECIFIC ROTATIONS
 # ============================================================================
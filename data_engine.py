@@ -5,21 +5,30 @@ FastF1 data fetching, telemetry processing, and ML data preparation
 
 import os
 import sys
+import functools
 import fastf1
 import fastf1.plotting
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 import numpy as np
 import json
-import pickle
 from datetime import timedelta
+from pathlib import Path
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from config import (
     FPS,
     DT,
     CACHE_DIR,
     FASTF1_CACHE_DIR,
     COMPUTED_DATA_DIR,
+    get_driver_color,
+    hex_to_rgb,
     get_tyre_compound_int,
     format_time,
 )
@@ -30,14 +39,22 @@ from config import (
 # ============================================================================
 
 
+_cache_enabled = False
+
+
 def enable_cache():
-    """Enable and configure FastF1 cache"""
+    """Enable and configure FastF1 cache (only the first call does any work)"""
+    global _cache_enabled
+    if _cache_enabled:
+        return
+
     if not os.path.exists(FASTF1_CACHE_DIR):
         os.makedirs(FASTF1_CACHE_DIR)
     if not os.path.exists(COMPUTED_DATA_DIR):
         os.makedirs(COMPUTED_DATA_DIR)
 
     fastf1.Cache.enable_cache(FASTF1_CACHE_DIR)
+    _cache_enabled = True
     print(f"Cache enabled at: {FASTF1_CACHE_DIR}")
 
 
@@ -66,36 +83,48 @@ def load_session(year, round_number, session_type="R"):
         return None
 
 
+# Event formats that include a sprint (covers the 2021-22, 2023 and 2024+ naming)
+SPRINT_EVENT_FORMATS = {"sprint", "sprint_shootout", "sprint_qualifying"}
+
+
+@functools.lru_cache(maxsize=16)
+def _load_race_weekends(year):
+    """Fetch and flatten the FastF1 event schedule (memoized per year)"""
+    schedule = fastf1.get_event_schedule(year)
+    n_events = len(schedule)
+
+    def column(name, default):
+        if name in schedule.columns:
+            return schedule[name].tolist()
+        return [default] * n_events
+
+    dates = schedule["EventDate"].dt.strftime("%Y-%m-%d").fillna("TBA").tolist()
+
+    return tuple(
+        {
+            "round_number": round_number,
+            "event_name": event_name,
+            "country": country,
+            "location": location,
+            "date": date,
+            "type": "sprint" if event_format in SPRINT_EVENT_FORMATS else "conventional",
+        }
+        for round_number, event_name, country, location, date, event_format in zip(
+            schedule["RoundNumber"].tolist(),
+            schedule["EventName"].tolist(),
+            column("Country", "N/A"),
+            column("Location", "N/A"),
+            dates,
+            column("EventFormat", None),
+        )
+    )
+
+
 def get_race_weekends_by_year(year):
     
     try:
-        schedule = fastf1.get_event_schedule(year)
-        events = []
-
-        for idx, event in schedule.iterrows():
-            event_type = "conventional"
-            # Check for sprint events (handles 'sprint', 'sprint_shootout', and 'sprint_qualifying' formats)
-            if (
-                event.get("EventFormat") == "sprint"
-                or event.get("EventFormat") == "sprint_shootout"
-                or event.get("EventFormat") == "sprint_qualifying"
-            ):
-                event_type = "sprint"
-
-            events.append(
-                {
-                    "round_number": event["RoundNumber"],
-                    "event_name": event["EventName"],
-                    "country": event.get("Country", "N/A"),
-                    "location": event.get("Location", "N/A"),
-                    "date": event["EventDate"].strftime("%Y-%m-%d")
-                    if pd.notna(event["EventDate"])
-                    else "TBA",
-                    "type": event_type,
-                }
-            )
-
-        return events
+        # Failed fetches raise before reaching the cache, so they are retried
+        return list(_load_race_weekends(year))
     except Exception as e:
         print(f"Error fetching schedule: {e}")
         return []
@@ -105,17 +134,25 @@ def list_rounds(year):
     """Print all rounds for a given year"""
     events = get_race_weekends_by_year(year)
     print(f"\n=== {year} F1 Season ===")
-    for event in events:
-        print(f"Round {event['round_number']}: {event['event_name']} ({event['date']})")
+    sys.stdout.write(
+        "".join(
+            f"Round {event['round_number']}: {event['event_name']} ({event['date']})\n"
+            for event in events
+        )
+    )
 
 
 def list_sprints(year):
     """Print all sprint rounds for a given year"""
     events = get_race_weekends_by_year(year)
-    sprint_events = [e for e in events if e["type"] == "sprint"]
     print(f"\n=== {year} F1 Sprint Rounds ===")
-    for event in sprint_events:
-        print(f"Round {event['round_number']}: {event['event_name']} ({event['date']})")
+    sys.stdout.write(
+        "".join(
+            f"Round {event['round_number']}: {event['event_name']} ({event['date']})\n"
+            for event in events
+            if event["type"] == "sprint"
+        )
+    )
 
 
 def get_circuit_rotation(session):
@@ -248,188 +285,219 @@ def determine_weather_condition(rainfall=0.0, humidity=50.0, air_temp=25.0, trac
 # TELEMETRY PROCESSING (Multi-threaded)
 # ============================================================================
 
+# Per-driver channels resampled onto the shared timeline (cache array names)
+TELEMETRY_CHANNELS = (
+    "x",
+    "y",
+    "dist",
+    "rel_dist",
+    "lap",
+    "tyre",
+    "speed",
+    "gear",
+    "drs",
+    "throttle",
+    "brake",
+)
+
+# Storage dtype per channel. Physical channels fit comfortably in float32 and
+# categorical channels are rounded back to integers. Race distance stays
+# float64 so position ranking keeps full precision over a whole race distance.
+RESAMPLED_DTYPES = {
+    "x": np.float32,
+    "y": np.float32,
+    "dist": np.float64,
+    "rel_dist": np.float32,
+    "lap": np.int16,
+    "tyre": np.int8,
+    "speed": np.float32,
+    "gear": np.int8,
+    "drs": np.int8,
+    "throttle": np.float32,
+    "brake": np.float32,
+}
+
+# One record per driver per frame: every channel plus the computed position
+FRAME_RECORD_DTYPE = np.dtype(
+    [(ch, RESAMPLED_DTYPES[ch]) for ch in TELEMETRY_CHANNELS] + [("position", np.int8)]
+)
+
+# Weather channels, in the order they appear in each frame's snapshot
+WEATHER_CHANNELS = (
+    "rainfall",
+    "track_temp",
+    "air_temp",
+    "humidity",
+    "pressure",
+    "wind_speed",
+    "wind_direction",
+)
+
+# Weather channel -> FastF1 weather_data column
+WEATHER_COLUMNS = {
+    "rainfall": "Rainfall",
+    "track_temp": "TrackTemp",
+    "air_temp": "AirTemp",
+    "humidity": "Humidity",
+    "pressure": "Pressure",
+    "wind_speed": "WindSpeed",
+    "wind_direction": "WindDirection",
+}
+
+
+def _interp_rows(x, xp, fp):
+    """np.interp for every row of ``fp`` (shape (n_rows, len(xp))) at once.
+
+    The bracketing search on ``xp`` is done a single time and shared by all
+    rows. Out-of-range ``x`` clamps to the end values, as np.interp does.
+    """
+    if len(xp) == 1:
+        return np.repeat(fp, len(x), axis=1)
+
+    idx = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    span = xp[idx + 1] - xp[idx]
+    frac = np.divide(x - xp[idx], span, out=np.zeros_like(x, dtype=np.float64), where=span != 0)
+    frac = np.clip(frac, 0.0, 1.0)
+
+    lower = fp[:, idx]
+    return lower + frac * (fp[:, idx + 1] - lower)
+
 
 def _process_single_driver(args):
     
-    driver_no, session, driver_code = args
+    driver_no, laps_driver, car_data, pos_data, driver_code = args
 
     print(f"Processing telemetry for driver: {driver_code}")
 
-    laps_driver = session.laps.pick_drivers(driver_no)
-    if laps_driver.empty:
+    if laps_driver is None or laps_driver.empty:
         return None
-
-    driver_max_lap = laps_driver.LapNumber.max() if not laps_driver.empty else 0
-
-    # Initialize data arrays
-    t_all = []
-    x_all = []
-    y_all = []
-    race_dist_all = []
-    rel_dist_all = []
-    lap_numbers = []
-    tyre_compounds = []
-    speed_all = []
-    gear_all = []
-    drs_all = []
-    throttle_all = []
-    brake_all = []
-
-    total_dist_so_far = 0.0
-
-    # Iterate through laps in order
-    for _, lap in laps_driver.iterlaps():
-        try:
-            lap_tel = lap.get_telemetry()
-        except ValueError:
-            print(f"  [Warning] Skipping corrupt lap {int(lap.LapNumber)} for {driver_code}")
-            continue
-        except Exception as e:
-            print(f"  [Error] Failed to process lap {int(lap.LapNumber)} for {driver_code}: {e}")
-            continue
-
-        lap_number = lap.LapNumber
-        tyre_compound_as_int = get_tyre_compound_int(lap.Compound)
-
-        if lap_tel.empty:
-            continue
-        
-        # Extract telemetry arrays
-        t_lap = lap_tel["SessionTime"].dt.total_seconds().to_numpy()
-        x_lap = lap_tel["X"].to_numpy()
-        y_lap = lap_tel["Y"].to_numpy()
-        d_lap = lap_tel["Distance"].to_numpy()
-        rd_lap = lap_tel["RelativeDistance"].to_numpy()
-        speed_kph_lap = lap_tel["Speed"].to_numpy()
-        gear_lap = lap_tel["nGear"].to_numpy()
-        drs_lap = lap_tel["DRS"].to_numpy()
-        throttle_lap = lap_tel["Throttle"].to_numpy()
-        brake_lap = lap_tel["Brake"].to_numpy().astype(float)
-
-        # Calculate cumulative race distance
-        race_d_lap = total_dist_so_far + d_lap
-
-        # Append to collection arrays
-        t_all.append(t_lap)
-        x_all.append(x_lap)
-        y_all.append(y_lap)
-        race_dist_all.append(race_d_lap)
-        rel_dist_all.append(rd_lap)
-        lap_numbers.append(np.full_like(t_lap, lap_number))
-        tyre_compounds.append(np.full_like(t_lap, tyre_compound_as_int))
-        speed_all.append(speed_kph_lap)
-        gear_all.append(gear_lap)
-        drs_all.append(drs_lap)
-        throttle_all.append(throttle_lap)
-        brake_all.append(brake_lap)
-
-        # Update total distance for next lap
-        if len(d_lap) > 0:
-            total_dist_so_far += d_lap[-1] 
-
-    if not t_all:
+    if car_data is None or car_data.empty or pos_data is None or pos_data.empty:
         return None
 
-    # Concatenate all arrays
-    all_arrays = [
-        t_all,
-        x_all,
-        y_all,
-        race_dist_all,
-        rel_dist_all,
-        lap_numbers,
-        tyre_compounds,
-        speed_all,
-        gear_all,
-        drs_all,
-    ]
+    driver_max_lap = laps_driver.LapNumber.max()
 
-    (
-        t_all,
-        x_all,
-        y_all,
-        race_dist_all,
-        rel_dist_all,
-        lap_numbers,
-        tyre_compounds,
-        speed_all,
-        gear_all,
-        drs_all,
-    ) = [np.concatenate(arr) for arr in all_arrays]
-
-    # Sort all arrays by time
-    order = np.argsort(t_all)
-    all_data = [
-        t_all,
-        x_all,
-        y_all,
-        race_dist_all,
-        rel_dist_all,
-        lap_numbers,
-        tyre_compounds,
-        speed_all,
-        gear_all,
-        drs_all,
-    ]
+    timed_laps = laps_driver.dropna(subset=["LapStartTime", "Time"])
+    if timed_laps.empty:
+        # e.g. a lap-1 retirement: laps exist but none of them were timed
+        return None
+    lap_start = timed_laps["LapStartTime"].dt.total_seconds().to_numpy()
+    lap_end = timed_laps["Time"].dt.total_seconds().to_numpy()
+    lap_numbers = timed_laps["LapNumber"].to_numpy()
+    lap_tyres = np.array([get_tyre_compound_int(c) for c in timed_laps["Compound"]])
+
+    # Work on the driver's whole-session car data at once instead of asking
+    # every lap for its own telemetry; samples are assigned to laps by time
+    car = car_data.add_distance()
+    car_t = car["SessionTime"].dt.total_seconds().to_numpy()
+    lap_idx = np.searchsorted(lap_start, car_t, side="right") - 1
+    on_lap = (lap_idx >= 0) & (car_t <= lap_end[np.maximum(lap_idx, 0)])
+    if not on_lap.any():
+        return None
 
-    (
-        t_all,
-        x_all,
-        y_all,
-        race_dist_all,
-        rel_dist_all,
-        lap_numbers,
-        tyre_compounds,
-        speed_all,
-        gear_all,
-        drs_all,
-    ) = [arr[order] for arr in all_data]
-
-    throttle_all = np.concatenate(throttle_all)[order]
-    brake_all = np.concatenate(brake_all)[order]
+    t = car_t[on_lap]
+    lap_idx = lap_idx[on_lap]
+    session_dist = car["Distance"].to_numpy()[on_lap]
+
+    # Distance into the current lap restarts at each lap's first sample
+    lap_first = np.flatnonzero(np.r_[True, np.diff(lap_idx) != 0])
+    samples_per_lap = np.diff(np.r_[lap_first, len(t)])
+    d_lap = session_dist - np.repeat(session_dist[lap_first], samples_per_lap)
+    lap_length = np.repeat(np.maximum.reduceat(d_lap, lap_first), samples_per_lap)
+    rel_dist = np.divide(
+        d_lap, lap_length, out=np.zeros_like(d_lap), where=lap_length > 0
+    )
+
+    pos_t = pos_data["SessionTime"].dt.total_seconds().to_numpy()
+
+    channels = {
+        "x": np.interp(t, pos_t, pos_data["X"].to_numpy()),
+        "y": np.interp(t, pos_t, pos_data["Y"].to_numpy()),
+        "dist": session_dist - session_dist[0],
+        "rel_dist": rel_dist,
+        "lap": lap_numbers[lap_idx],
+        "tyre": lap_tyres[lap_idx],
+        "speed": car["Speed"].to_numpy()[on_lap],
+        "gear": car["nGear"].to_numpy()[on_lap],
+        "drs": car["DRS"].to_numpy()[on_lap],
+        "throttle": car["Throttle"].to_numpy()[on_lap],
+        "brake": car["Brake"].to_numpy()[on_lap],
+    }
+    data = {ch: values.astype(RESAMPLED_DTYPES[ch]) for ch, values in channels.items()}
+    data["t"] = t
 
     print(f"Completed telemetry for driver: {driver_code}")
 
     return {
         "code": driver_code,
-        "data": {
-            "t": t_all,
-            "x": x_all,
-            "y": y_all,
-            "dist": race_dist_all,
-            "rel_dist": rel_dist_all,
-            "lap": lap_numbers,
-            "tyre": tyre_compounds,
-            "speed": speed_all,
-            "gear": gear_all,
-            "drs": drs_all,
-            "throttle": throttle_all,
-            "brake": brake_all,
-        },
-        "t_min": t_all.min(),
-        "t_max": t_all.max(),
+        "data": data,
+        "t_min": t[0],
+        "t_max": t[-1],
         "max_lap": driver_max_lap,
     }
 
+
+def _driver_metadata(session):
+    """Map driver number -> (abbreviation, RGB color) in one pass over results"""
+    metadata = {}
+    results = session.results
+    if results is not None and not results.empty:
+        rows = results[["DriverNumber", "Abbreviation", "TeamColor"]].itertuples(
+            index=False
+        )
+        for driver_no, code, team_color in rows:
+            if not isinstance(code, str) or not code:
+                code = str(driver_no)
+            if isinstance(team_color, str) and len(team_color.lstrip("#")) == 6:
+                color = hex_to_rgb(team_color)
+            else:
+                color = get_driver_color(code, session)
+            metadata[str(driver_no)] = (code, color)
+
+    # Drivers missing from the results still need a code and a color
+    for driver_no in session.drivers:
+        if driver_no not in metadata:
+            metadata[driver_no] = (str(driver_no), get_driver_color(str(driver_no), session))
+
+    return metadata
+
+
+# Race telemetry already assembled in this process, keyed by
+# (year, event name, round number, session type). Only the most recent race
+# is kept, since a replay holds a whole session's frames
+_TELEMETRY_MEM_CACHE = {}
+
+
+def _remember_race_data(mem_key, race_data):
+    _TELEMETRY_MEM_CACHE.clear()
+    _TELEMETRY_MEM_CACHE[mem_key] = race_data
+
+
 def get_race_telemetry(session, session_type="R", force_refresh=False):
-    # Check for cached data
-    cache_filename = f"{COMPUTED_DATA_DIR}/race_{session.event['EventName'].replace(' ', '_')}_{session.event['RoundNumber']}_{session_type}.pkl"
+    event_name = session.event["EventName"]
+    round_number = int(session.event["RoundNumber"])
+    mem_key = (session.event.year, event_name, round_number, session_type)
+    if not force_refresh and mem_key in _TELEMETRY_MEM_CACHE:
+        return _TELEMETRY_MEM_CACHE[mem_key]
 
-    if os.path.exists(cache_filename) and not force_refresh:
-        print(f"Loading cached telemetry from: {cache_filename}")
-        with open(cache_filename, "rb") as f:
-            return pickle.load(f)
+    # Check for cached data
+    cache_stem = f"race_{event_name.replace(' ', '_')}_{round_number}_{session_type}"
+    arrays_filename = Path(COMPUTED_DATA_DIR) / f"{cache_stem}.npz"
+    meta_filename = Path(COMPUTED_DATA_DIR) / f"{cache_stem}.json"
+
+    if arrays_filename.is_file() and meta_filename.is_file() and not force_refresh:
+        print(f"Loading cached telemetry from: {arrays_filename}")
+        arrays, meta = _load_telemetry_cache(arrays_filename, meta_filename)
+        if "telemetry" in arrays:
+            race_data = _assemble_race_data(arrays, meta)
+            _remember_race_data(mem_key, race_data)
+            return race_data
+        print("Cached telemetry uses an older layout, recomputing...")
 
     print("Computing race telemetry...")
 
     drivers = session.drivers
-    driver_codes = {}
-    for driver_no in drivers:
-        try:
-            driver_info = session.get_driver(driver_no)
-            driver_codes[driver_no] = driver_info["Abbreviation"]
-        except:
-            driver_codes[driver_no] = str(driver_no)
+    driver_meta = _driver_metadata(session)
+    driver_codes = {driver_no: code for driver_no, (code, _) in driver_meta.items()}
 
     # Process all drivers in parallel
     driver_data = {}
@@ -438,13 +506,27 @@ def get_race_telemetry(session, session_type="R", force_refresh=False):
     max_lap_number = 0
 
     print(f"Processing {len(drivers)} drivers in parallel...")
+    # Split the laps table by driver once instead of filtering it per worker
+    laps_by_driver = {
+        driver_no: laps for driver_no, laps in session.laps.groupby("DriverNumber")
+    }
     driver_args = [
-        (driver_no, session, driver_codes[driver_no]) for driver_no in drivers
+        (
+            driver_no,
+            laps_by_driver.get(driver_no),
+            session.car_data.get(driver_no),
+            session.pos_data.get(driver_no),
+            driver_codes[driver_no],
+        )
+        for driver_no in drivers
     ]
 
-    num_processes = min(cpu_count(), len(drivers))
+    # Threads share the loaded session instead of pickling it into every
+    # worker process; the heavy lifting happens in pandas and numpy, which
+    # release the GIL.
+    num_workers = min(cpu_count(), len(drivers))
 
-    with Pool(processes=num_processes) as pool:
+    with ThreadPool(num_workers) as pool:
         results = pool.map(_process_single_driver, driver_args)
 
     # Process results
@@ -475,67 +557,28 @@ def get_race_telemetry(session, session_type="R", force_refresh=False):
 
     print(f"Resampling to {n_frames} frames at {FPS} FPS...")
 
-    # Resample all driver data to unified timeline
-    resampled_data = {}
-    for code, data in driver_data.items():
-        t_sorted = data["t"]
-        order = np.argsort(t_sorted)
-        t_sorted = t_sorted[order]
-
-        arrays_to_resample = [
-            data["x"][order],
-            data["y"][order],
-            data["dist"][order],
-            data["rel_dist"][order],
-            data["lap"][order],
-            data["tyre"][order],
-            data["speed"][order],
-            data["gear"][order],
-            data["drs"][order],
-            data["throttle"][order],
-            data["brake"][order],
-        ]
+    # Resample every driver straight into one (n_drivers, n_frames) record
+    # array; row d belongs to codes[d]. This is what gets cached, and frame
+    # dicts are rebuilt from it on load.
+    codes = list(driver_data.keys())
+    telemetry = np.empty((len(codes), n_frames), dtype=FRAME_RECORD_DTYPE)
 
-        resampled = [np.interp(timeline, t_sorted, arr) for arr in arrays_to_resample]
-        (
-            x_r,
-            y_r,
-            dist_r,
-            rel_dist_r,
-            lap_r,
-            tyre_r,
-            speed_r,
-            gear_r,
-            drs_r,
-            throttle_r,
-            brake_r,
-        ) = resampled
-
-        resampled_data[code] = {
-            "t": timeline,
-            "x": x_r,
-            "y": y_r,
-            "dist": dist_r,
-            "rel_dist": rel_dist_r,
-            "lap": lap_r,
-            "tyre": tyre_r,
-            "speed": speed_r,
-            "gear": gear_r,
-            "drs": drs_r,
-            "throttle": throttle_r,
-            "brake": brake_r,
-        }
+    # _process_single_driver returns time-ordered samples, which is exactly
+    # the monotonic xp that np.interp needs, so no re-sort/gather here
+    for d, code in enumerate(codes):
+        data = driver_data[code]
+
+        for ch in TELEMETRY_CHANNELS:
+            values = np.interp(timeline, data["t"], data[ch])
+            if np.issubdtype(RESAMPLED_DTYPES[ch], np.integer):
+                values = np.rint(values)
+            telemetry[ch][d] = values
 
-    # Get driver colors
-    driver_colors = {}
-    for code in resampled_data.keys():
-        try:
-            color = fastf1.plotting.get_driver_color(code, session)
-            # Convert hex to RGB tuple
-            color = color.lstrip("#")
-            driver_colors[code] = tuple(int(color[i : i + 2], 16) for i in (0, 2, 4))
-        except:
-            driver_colors[code] = (255, 255, 255)
+    telemetry["position"] = _compute_positions(telemetry["dist"])
+    arrays = {"timeline": timeline, "telemetry": telemetry}
+
+    colors_by_code = dict(driver_meta.values())
+    driver_colors = {code: colors_by_code[code] for code in codes}
 
     # Extract weather data if available
     weather_resampled = None
@@ -543,30 +586,14 @@ def get_race_telemetry(session, session_type="R", force_refresh=False):
         weather = session.weather_data
         if weather is not None and not weather.empty:
             weather_t = weather["Time"].dt.total_seconds().to_numpy()
-            weather_resampled = {
-                "rainfall": np.interp(
-                    timeline, weather_t, weather["Rainfall"].to_numpy()
-                ),
-                "track_temp": np.interp(
-                    timeline, weather_t, weather["TrackTemp"].to_numpy()
-                ),
-                "air_temp": np.interp(
-                    timeline, weather_t, weather["AirTemp"].to_numpy()
-                ),
-                "humidity": np.interp(
-                    timeline, weather_t, weather["Humidity"].to_numpy()
-                ),
-                "pressure": np.interp(
-                    timeline, weather_t, weather["Pressure"].to_numpy()
-                ),
-                "wind_speed": np.interp(
-                    timeline, weather_t, weather["WindSpeed"].to_numpy()
-                ),
+            columns = {
+                key: column
+                for key, column in WEATHER_COLUMNS.items()
+                if column in weather.columns
             }
-            if "WindDirection" in weather.columns:
-                weather_resampled["wind_direction"] = np.interp(
-                    timeline, weather_t, weather["WindDirection"].to_numpy()
-                )
+            weather_matrix = weather[list(columns.values())].to_numpy(dtype=np.float64)
+            interpolated = _interp_rows(timeline, weather_t, weather_matrix.T)
+            weather_resampled = dict(zip(columns, interpolated))
     except Exception as e:
         print(f"Weather data not available: {e}")
 
@@ -588,108 +615,170 @@ def get_race_telemetry(session, session_type="R", force_refresh=False):
     except Exception as e:
         print(f"Track status not available: {e}")
 
-    # Build frames
-    frames = []
-    print("Building frames...")
-
-    for i, t in enumerate(timeline):
-        # Sort drivers by race distance (position)
-        cars = []
-        for code, data in resampled_data.items():
-            cars.append(
-                {
-                    "code": code,
-                    "x": data["x"][i],
-                    "y": data["y"][i],
-                    "dist": data["dist"][i],
-                    "rel_dist": data["rel_dist"][i],
-                    "lap": int(data["lap"][i]),
-                    "tyre": int(data["tyre"][i]),
-                    "speed": data["speed"][i],
-                    "gear": int(data["gear"][i]),
-                    "drs": int(data["drs"][i]),
-                    "throttle": data["throttle"][i],
-                    "brake": data["brake"][i],
-                }
-            )
-
-        cars.sort(key=lambda c: -c["dist"])
-
-        frame_data = {}
-        for idx, car in enumerate(cars):
-            code = car["code"]
-            position = idx + 1
-
-            frame_data[code] = {
-                "x": car["x"],
-                "y": car["y"],
-                "dist": car["dist"],
-                "lap": car["lap"],
-                "rel_dist": round(car["rel_dist"], 4),
-                "tyre": car["tyre"],
-                "position": position,
-                "speed": car["speed"],
-                "gear": car["gear"],
-                "drs": car["drs"],
-                "throttle": car["throttle"],
-                "brake": car["brake"],
-            }
-
-        weather_snapshot = {}
-        if weather_resampled:
-            try:
-                weather_snapshot = {
-                    "rainfall": float(weather_resampled["rainfall"][i]),
-                    "track_temp": float(weather_resampled["track_temp"][i]),
-                    "air_temp": float(weather_resampled["air_temp"][i]),
-                    "humidity": float(weather_resampled["humidity"][i]),
-                    "pressure": float(weather_resampled["pressure"][i]),
-                    "wind_speed": float(weather_resampled["wind_speed"][i]),
-                }
-                if "wind_direction" in weather_resampled:
-                    weather_snapshot["wind_direction"] = float(
-                        weather_resampled["wind_direction"][i]
-                    )
-            except:
-                pass
-
-        # Enhanced weather condition determination with night race detection
-        if weather_snapshot is not None:
-            is_night_race = calculate_night_race(session, t)
-            
-            # Determine weather condition based on data and night status
-            weather_condition = determine_weather_condition(
-                rainfall=weather_snapshot.get("rainfall", 0.0),
-                humidity=weather_snapshot.get("humidity", 50.0),
-                air_temp=weather_snapshot.get("air_temp", 25.0),
-                track_temp=weather_snapshot.get("track_temp", 35.0),
-                is_night=is_night_race
-            )
-            
-            weather_snapshot["weather"] = weather_condition
-            weather_snapshot["is_night"] = is_night_race
-
-        frames.append(
-            {
-                "time": float(t),
-                "drivers": frame_data,
-                "weather": weather_snapshot if weather_snapshot else None,
-            }
+    # Resolve the weather condition for every frame up front
+    print("Resolving weather conditions...")
+    weather_resampled = weather_resampled or {}
+    for key, values in weather_resampled.items():
+        arrays[f"weather_{key}"] = values
+
+    is_night = [calculate_night_race(session, t) for t in timeline]
+    weather_inputs = [
+        weather_resampled[key].tolist() if key in weather_resampled else [default] * n_frames
+        for key, default in (
+            ("rainfall", 0.0),
+            ("humidity", 50.0),
+            ("air_temp", 25.0),
+            ("track_temp", 35.0),
+        )
+    ]
+    weather_conditions = [
+        determine_weather_condition(
+            rainfall=rainfall,
+            humidity=humidity,
+            air_temp=air_temp,
+            track_temp=track_temp,
+            is_night=night,
+        )
+        for rainfall, humidity, air_temp, track_temp, night in zip(
+            *weather_inputs, is_night
         )
+    ]
+    arrays["is_night"] = np.array(is_night, dtype=bool)
+    arrays["weather_condition"] = np.array(weather_conditions)
 
-    result = {
-        "frames": frames,
+    meta = {
+        "codes": codes,
         "driver_colors": driver_colors,
         "track_statuses": track_statuses,
         "total_laps": int(max_lap_number),
     }
 
     # Cache the result
-    print(f"Caching telemetry to: {cache_filename}")
-    with open(cache_filename, "wb") as f:
-        pickle.dump(result, f)
+    print(f"Caching telemetry to: {arrays_filename}")
+    _save_telemetry_cache(arrays_filename, meta_filename, arrays, meta)
+
+    race_data = _assemble_race_data(arrays, meta)
+    _remember_race_data(mem_key, race_data)
+    return race_data
+
+
+def _save_telemetry_cache(arrays_filename, meta_filename, arrays, meta):
+    """Write the telemetry arrays (.npz) and their JSON metadata sidecar"""
+    np.savez_compressed(arrays_filename, **arrays)
+    with open(meta_filename, "w") as f:
+        json.dump(meta, f)
+
+
+def _load_telemetry_cache(arrays_filename, meta_filename):
+    """Read back what _save_telemetry_cache wrote"""
+    with np.load(arrays_filename) as npz:
+        arrays = {key: npz[key] for key in npz.files}
+    with open(meta_filename) as f:
+        meta = json.load(f)
+    return arrays, meta
+
+
+def _assemble_race_data(arrays, meta):
+    """Build the race telemetry result consumed by the Vision module"""
+    return {
+        "frames": RaceFrames(arrays, meta["codes"]),
+        "driver_colors": {
+            code: tuple(color) for code, color in meta["driver_colors"].items()
+        },
+        "track_statuses": meta["track_statuses"],
+        "total_laps": meta["total_laps"],
+    }
+
 
-    return result
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def _rank_by_distance(dist):
+        n_drivers, n_frames = dist.shape
+        positions = np.empty((n_drivers, n_frames), np.int8)
+        for i in prange(n_frames):
+            order = np.argsort(-dist[:, i], kind="mergesort")
+            for r in range(n_drivers):
+                positions[order[r], i] = r + 1
+        return positions
+
+
+def _compute_positions(dist):
+    """Race position (1 = leader) of every driver in every frame.
+
+    ``dist`` has shape (n_drivers, n_frames). Drivers are ranked by race
+    distance; a stable sort keeps tied drivers in their original order,
+    like list.sort. Uses the numba kernel (parallel over frames) when numba
+    is installed.
+    """
+    if njit is not None:
+        return _rank_by_distance(np.ascontiguousarray(dist))
+
+    running_order = np.argsort(-dist, axis=0, kind="stable")
+    ranks = np.arange(1, dist.shape[0] + 1, dtype=np.int8)[:, None]
+    positions = np.empty(dist.shape, dtype=np.int8)
+    np.put_along_axis(
+        positions, running_order, np.broadcast_to(ranks, dist.shape), axis=0
+    )
+    return positions
+
+
+class RaceFrames:
+    """List-like view over the (n_drivers, n_frames) telemetry records.
+
+    Playback only ever looks at one frame at a time, so each frame dict is
+    built on demand in __getitem__ instead of materializing every frame (and
+    every per-driver dict in it) up front.
+    """
+
+    __slots__ = ("_arrays", "_codes", "_weather_keys")
+
+    def __init__(self, arrays, codes):
+        self._arrays = arrays
+        self._codes = codes
+        self._weather_keys = [
+            key for key in WEATHER_CHANNELS if f"weather_{key}" in arrays
+        ]
+
+    def __len__(self):
+        return len(self._arrays["timeline"])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        n_frames = len(self)
+        if i < 0:
+            i += n_frames
+        if not 0 <= i < n_frames:
+            raise IndexError("frame index out of range")
+
+        arrays = self._arrays
+        records = arrays["telemetry"][:, i]
+        rows = records.tolist()
+
+        # Drivers are listed in running order
+        frame_data = {}
+        for d in np.argsort(records["position"]).tolist():
+            state = dict(zip(FRAME_RECORD_DTYPE.names, rows[d]))
+            state["rel_dist"] = round(state["rel_dist"], 4)
+            frame_data[self._codes[d]] = state
+
+        weather_snapshot = {
+            key: arrays[f"weather_{key}"][i].item() for key in self._weather_keys
+        }
+        weather_snapshot["weather"] = arrays["weather_condition"][i].item()
+        weather_snapshot["is_night"] = arrays["is_night"][i].item()
+
+        return {
+            "time": arrays["timeline"][i].item(),
+            "drivers": frame_data,
+            "weather": weather_snapshot,
+        }
 
 
 # ============================================================================
@@ -700,40 +789,37 @@ def get_race_telemetry(session, session_type="R", force_refresh=False):
 def get_quali_telemetry(session, session_type="Q"):
     results = []
 
+    # Best lap per driver in each segment, one groupby per segment rather
+    # than masking every driver's laps three times
+    laps = session.laps
+    segment_bests = {
+        segment: laps["LapTime"]
+        .where(laps[segment].notna())
+        .groupby(laps["DriverNumber"])
+        .min()
+        .dt.total_seconds()
+        .dropna()
+        .to_dict()
+        for segment in ("Q1", "Q2", "Q3")
+    }
+
     for driver in session.drivers:
-        driver_laps = session.laps.pick_drivers(driver)
+        driver_laps = laps.pick_drivers(driver)
         if driver_laps.empty:
             continue
 
         driver_info = session.get_driver(driver)
         driver_code = driver_info["Abbreviation"]
 
-        # Get best lap times from each segment
-        q1_time = None
-        q2_time = None
-        q3_time = None
-
-        q1_laps = driver_laps[driver_laps["Q1"].notna()]
-        if not q1_laps.empty:
-            q1_time = q1_laps["LapTime"].min()
-
-        q2_laps = driver_laps[driver_laps["Q2"].notna()]
-        if not q2_laps.empty:
-            q2_time = q2_laps["LapTime"].min()
-
-        q3_laps = driver_laps[driver_laps["Q3"].notna()]
-        if not q3_laps.empty:
-            q3_time = q3_laps["LapTime"].min()
-
         # Get overall best lap
         best_lap = driver_laps.pick_fastest()
 
         results.append(
             {
                 "driver": driver_code,
-                "q1": q1_time.total_seconds() if q1_time else None,
-                "q2": q2_time.total_seconds() if q2_time else None,
-                "q3": q3_time.total_seconds() if q3_time else None,
+                "q1": segment_bests["Q1"].get(driver),
+                "q2": segment_bests["Q2"].get(driver),
+                "q3": segment_bests["Q3"].get(driver),
                 "best": best_lap["LapTime"].total_seconds()
                 if best_lap is not None and pd.notna(best_lap["LapTime"])
                 else None,
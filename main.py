@@ -4,7 +4,11 @@ Persistent menu for Year/Round selection and module launching
 """
 
 import sys
+import json
 import os
+import time
+from datetime import datetime
+from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -14,38 +18,376 @@ from PySide6.QtWidgets import (
     QLabel,
     QComboBox,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QMessageBox,
     QGroupBox,
     QRadioButton,
 )
-from PySide6.QtCore import QThread, Signal, Qt
-from PySide6.QtGui import QPixmap
-import subprocess
-import tempfile
-import uuid
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QThread,
+    QThreadPool,
+    QRunnable,
+    QSize,
+    QTimer,
+    Signal,
+    Qt,
+)
+from PySide6.QtGui import QFont, QImageReader, QPixmap, QPixmapCache
+from functools import lru_cache
+
+# subprocess/tempfile and data_engine (FastF1, pandas, numpy) are
+# imported where they are used, so the launcher window appears before any
+# of them have loaded
+
+
+# ============================================================================
+# STYLESHEETS
+# ============================================================================
+
+# Window-wide theme, applied once to the launcher
+LAUNCHER_QSS = """
+QMainWindow, QWidget {
+    background-color: #FFFFFF;
+    color: #000000;
+    font-family: 'Jura', sans-serif;
+}
+QLabel {
+    color: #000000;
+}
+QGroupBox {
+    border: 1px solid #CCCCCC;
+    border-radius: 5px;
+    margin-top: 10px;
+    font-weight: bold;
+    color: #000000;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+/* --- RED RADIO BUTTONS --- */
+QRadioButton {
+    spacing: 8px;
+    color: #000000;
+}
+QRadioButton::indicator {
+    width: 16px;
+    height: 16px;
+    border-radius: 9px;
+    border: 2px solid #555555;
+}
+QRadioButton::indicator:checked {
+    background-color: #e10600; /* F1 Red */
+    border: 2px solid #e10600;
+}
+QRadioButton::indicator:unchecked:hover {
+    border: 2px solid #e10600;
+}
+/* --- TREE WIDGET STYLING --- */
+QTreeView {
+    border: 1px solid #ccc;
+    font-size: 13px;
+    background-color: white;
+    alternate-background-color: #f9f9f9;
+}
+QHeaderView::section {
+    background-color: #f0f0f0;
+    padding: 4px;
+    border: 1px solid #ddd;
+    font-weight: bold;
+}
+"""
 
-from data_engine import get_race_weekends_by_year, enable_cache
+# Year selector
+YEAR_COMBO_QSS = """
+QComboBox {
+    border: 1px solid #ccc;
+    border-radius: 4px;
+    padding: 5px;
+    min-width: 100px;
+    font-size: 14px;
+}
+"""
 
+# Shared by the three big module buttons
+MODULE_BUTTON_QSS = """
+QPushButton {
+    background-color: #e10600;
+    color: white;
+    font-size: 46px;
+    border-radius: 15px;
+}
+QPushButton:hover {
+    background-color: #ff1e00;
+    border: 2px solid white;
+}
+"""
 
-class FetchScheduleWorker(QThread):
-    """Worker thread to fetch race schedule without blocking UI"""
+# Red status bar at the bottom of the launcher
+STATUS_LABEL_QSS = """
+padding: 8px;
+background-color: #e10600;
+font-size: 16px;
+color: white;
+border-radius: 4px;
+"""
 
-    result = Signal(object)
-    error = Signal(str)
 
-    def __init__(self, year, parent=None):
-        super().__init__(parent)
+@lru_cache(maxsize=16)
+def make_font(pixel_size, bold=False):
+    """Shared font for widgets that only need a size/weight tweak.
+
+    The family still comes from the window stylesheet.
+    """
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+# Modules kept pre-started with "--serve" so a click skips interpreter
+# startup and the PySide6/pandas/FastF1 imports
+WARM_MODULES = ("module_vision.py", "module_analytics.py")
+
+# Session codes the launcher can hand to a module
+SESSION_NAMES = {"R": "Race", "S": "Sprint"}
+
+# Popen options for every module launch. Our fds are non-inheritable anyway
+# (PEP 446), so close_fds=False skips walking the fd table in the child; with
+# no preexec_fn/uid/gid changes CPython vforks, so the launcher's address
+# space is never copied. The new session keeps a Ctrl+C in the launcher's
+# terminal from taking open modules down with it. stdout/stderr stay
+# inherited: the modules report errors by printing.
+_SPAWN_KWARGS = {"close_fds": False, "start_new_session": True}
+
+LOGO_HEIGHT = 85
+LOGO_CACHE_KEY = f"f1_logo_{LOGO_HEIGHT}"
+
+
+def _load_logo():
+    """Header logo decoded straight at display height (null if missing)
+
+    Kept in QPixmapCache rather than a module global so it is shared by any
+    window in the process and released along with the QApplication.
+    """
+    pixmap = QPixmapCache.find(LOGO_CACHE_KEY)
+    if pixmap is not None:
+        return pixmap
+    reader = QImageReader("f1_logo.png")
+    size = reader.size()
+    if size.isValid() and size.height() > 0:
+        width = round(size.width() * LOGO_HEIGHT / size.height())
+        reader.setScaledSize(QSize(width, LOGO_HEIGHT))
+    image = reader.read()
+    pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+    QPixmapCache.insert(LOGO_CACHE_KEY, pixmap)
+    return pixmap
+
+
+# Per-year schedules survive launcher restarts here, so a warm start shows
+# the calendar without waiting on FastF1
+SCHEDULE_CACHE_DIR = Path.home() / ".cache" / "f1insighthub"
+
+
+def _schedule_cache_path(year):
+    return SCHEDULE_CACHE_DIR / f"schedule_{year}.json"
+
+
+def _schedule_cache_ttl(year):
+    # The current season's calendar can still change; past ones rarely do
+    return 86400 if year == datetime.now().year else 7 * 86400
+
+
+def _read_schedule_cache(year):
+    """(events, is_fresh) from the on-disk copy, or None if there is none"""
+    path = _schedule_cache_path(year)
+    try:
+        age = time.time() - path.stat().st_mtime
+        events = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not events:
+        return None
+    return events, age < _schedule_cache_ttl(year)
+
+
+def _write_schedule_cache(year, events):
+    import tempfile
+
+    path = _schedule_cache_path(year)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and swap it in, so a reader (or a second
+        # writer for the same year) never sees a half-written file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    except OSError as e:
+        print(f"Could not write schedule cache {path}: {e}")
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(events, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError) as e:
+        # Don't leave an orphaned temp file behind for every failed write
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        print(f"Could not write schedule cache {path}: {e}")
+
+
+def _load_weekends(year):
+    """Schedule for a year, from the on-disk copy while it's fresh.
+
+    An empty schedule means the fetch failed; fall back to a stale copy if
+    there is one, otherwise raise instead of letting callers cache it.
+    """
+    cached = _read_schedule_cache(year)
+    if cached is not None and cached[1]:
+        return cached[0]
+
+    from data_engine import get_race_weekends_by_year, enable_cache
+
+    enable_cache()
+    events = get_race_weekends_by_year(year)
+    if not events:
+        if cached is not None:
+            return cached[0]
+        raise RuntimeError(f"No race calendar available for {year}")
+
+    _write_schedule_cache(year, events)
+    return events
+
+
+# Fields whose values repeat across events and seasons
+_INTERNED_EVENT_FIELDS = ("type", "country", "location")
+
+
+def _intern_event(event):
+    """Copy of an event dict with shared keys and repeating values interned.
+
+    Schedules read back from the disk cache come with fresh string objects;
+    interning lets every cached season share one copy of them.
+    """
+    return {
+        sys.intern(key): sys.intern(value)
+        if key in _INTERNED_EVENT_FIELDS and isinstance(value, str)
+        else value
+        for key, value in event.items()
+    }
+
+
+@lru_cache(maxsize=32)
+def _cached_weekends(year):
+    """(events, display rows) for a year, built once per launcher session"""
+    return _schedule_payload(_load_weekends(year))
+
+
+def _schedule_payload(raw_events):
+    """(events, display rows) for a list of schedule event dicts.
+
+    Display rows are the schedule tree's column strings, so repopulating
+    the tree for a year seen before does no per-event formatting. Both are
+    tuples so a shared cached value can't be mutated by callers.
+    """
+    events = tuple(_intern_event(event) for event in raw_events)
+    for event in events:
+        # Schedule types are already lowercase ("sprint"/"conventional")
+        event["has_sprint"] = "sprint" in event["type"]
+    display = tuple(
+        (
+            str(event["round_number"]),
+            event["event_name"],
+            event.get("country", "N/A"),
+            event["date"],
+            event["type"],
+        )
+        for event in events
+    )
+    return events, display
+
+
+class ScheduleSignals(QObject):
+    """Carries schedule fetch results from the thread pool back to the UI"""
+
+    result = Signal(int, object)
+    error = Signal(int, str)
+    # Background prefetch finished; payload is None if it failed
+    prefetched = Signal(int, object)
+
+
+class FetchScheduleTask(QRunnable):
+    """Fetch a race schedule on the thread pool without blocking the UI"""
+
+    def __init__(self, year, signals):
+        super().__init__()
+        # Owned from Python so a queued fetch can still be taken back
+        self.setAutoDelete(False)
         self.year = year
+        self.signals = signals
 
     def run(self):
         try:
-            enable_cache()
-            events = get_race_weekends_by_year(self.year)
-            self.result.emit(events)
+            self.signals.result.emit(self.year, _cached_weekends(self.year))
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(self.year, str(e))
+
+
+class PrefetchScheduleTask(QRunnable):
+    """Warm the schedule cache for a year the user is likely to pick next"""
+
+    def __init__(self, year, signals):
+        super().__init__()
+        self.year = year
+        self.signals = signals
+
+    def run(self):
+        try:
+            payload = _cached_weekends(self.year)
+        except Exception:
+            # Only a prefetch; a real selection will retry and report errors
+            payload = None
+        self.signals.prefetched.emit(self.year, payload)
+
+
+class ScheduleModel(QAbstractTableModel):
+    """Race calendar rows served straight from the cached display tuples"""
+
+    HEADERS = ("Round", "Event", "Country", "Date")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._events = ()
+        self._rows = ()
+
+    def set_schedule(self, events, rows):
+        self.beginResetModel()
+        self._events = events
+        self._rows = rows
+        self.endResetModel()
+
+    def event_at(self, row):
+        return self._events[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
 
 class F1InsightHubLauncher(QMainWindow):
@@ -53,9 +395,30 @@ class F1InsightHubLauncher(QMainWindow):
 
     def __init__(self):
         super().__init__()
-        self.worker = None
+        # Always emitted from pool threads; queue explicitly so a slot never
+        # runs on (or blocks) a worker thread
+        self.schedule_signals = ScheduleSignals(self)
+        self.schedule_signals.result.connect(self.on_schedule_loaded, Qt.QueuedConnection)
+        self.schedule_signals.error.connect(self.on_schedule_error, Qt.QueuedConnection)
+        self.schedule_signals.prefetched.connect(self.on_schedule_prefetched, Qt.QueuedConnection)
+        # Prefetches get their own single low-priority thread so they never
+        # hold up a fetch the user is actually waiting for
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+        self._prefetch_pool.setThreadPriority(QThread.LowPriority)
+        # Fetches the user is waiting on; kept off the global pool so other
+        # work queued there can never sit in front of them
+        self._fetch_pool = QThreadPool(self)
+        self._fetch_pool.setMaxThreadCount(2)
+        self._prefetching = set()
         self.events_data = []
+        self._loaded_year = None
+        # year -> (events, display) payloads this window has already shown
+        self._schedule_cache = {}
+        self._pending_fetch = None
         self.selected_event = None
+        # script -> idle "--serve" process already past its heavy imports
+        self._warm_modules = {}
 
         self.setWindowTitle("F1 Insight Hub - Race Analysis Platform")
         self._setup_ui()
@@ -63,68 +426,19 @@ class F1InsightHubLauncher(QMainWindow):
         self.setMinimumSize(900, 600)
 
         # Load initial schedule
-        self.load_schedule()
+        self._do_load_schedule()
+        # Warm the modules once the window is up, not before
+        QTimer.singleShot(0, self._warm_up_modules)
 
     def _setup_ui(self):
         """Setup the main UI layout"""
         
         # --- GLOBAL STYLESHEET ---
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #FFFFFF;
-                color: #000000;
-                font-family: 'Jura', sans-serif;
-            }
-            QLabel {
-                color: #000000;
-            }
-            QGroupBox {
-                border: 1px solid #CCCCCC;
-                border-radius: 5px;
-                margin-top: 10px;
-                font-weight: bold;
-                color: #000000;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            /* --- RED RADIO BUTTONS --- */
-            QRadioButton {
-                spacing: 8px;
-                color: #000000;
-            }
-            QRadioButton::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 9px;
-                border: 2px solid #555555;
-            }
-            QRadioButton::indicator:checked {
-                background-color: #e10600; /* F1 Red */
-                border: 2px solid #e10600;
-            }
-            QRadioButton::indicator:unchecked:hover {
-                border: 2px solid #e10600;
-            }
-            /* --- TREE WIDGET STYLING --- */
-            QTreeWidget {
-                border: 1px solid #ccc;
-                font-size: 13px;
-                background-color: white;
-                alternate-background-color: #f9f9f9;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                padding: 4px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-            }
-        """)
+        self.setStyleSheet(LAUNCHER_QSS)
 
+        # The whole tree is built detached and attached with setCentralWidget
+        # at the end, so the window lays it out once
         central_widget = QWidget()
-        self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout()
         central_widget.setLayout(main_layout)
 
@@ -138,17 +452,16 @@ class F1InsightHubLauncher(QMainWindow):
         header_container.setLayout(header_layout)
 
         logo_label = QLabel()
-        logo_pixmap = QPixmap("f1_logo.png") 
-        
+        logo_pixmap = _load_logo()
+
         if not logo_pixmap.isNull():
-            scaled_logo = logo_pixmap.scaledToHeight(85, Qt.SmoothTransformation)
-            logo_label.setPixmap(scaled_logo)
+            logo_label.setPixmap(logo_pixmap)
         else:
             logo_label.setText("F1") 
             logo_label.setStyleSheet("font-size: 30px; font-weight: bold; color: #e10600;")
         
         title_text = QLabel("Insight Hub")
-        title_text.setStyleSheet("font-size: 53px; margin-left: 0px;")
+        title_text.setFont(make_font(53))
         
         header_layout.addWidget(logo_label)
         header_layout.addWidget(title_text)
@@ -165,24 +478,26 @@ class F1InsightHubLauncher(QMainWindow):
         # 2. Year Selection
         # ====================================================================
         year_layout = QHBoxLayout()
+        # Nested layouts: pin the zero margins instead of leaving them to the style
+        year_layout.setContentsMargins(0, 0, 0, 0)
         year_label = QLabel("Select Year:")
-        year_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        year_label.setFont(make_font(16, bold=True))
 
         self.year_combo = QComboBox()
-        self.year_combo.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 5px;
-                min-width: 100px;
-                font-size: 14px;
-            }
-        """)
+        self.year_combo.setStyleSheet(YEAR_COMBO_QSS)
         current_year = 2025
-        for year in range(current_year, 2017, -1):
-            self.year_combo.addItem(str(year))
-        self.year_combo.setCurrentText(str(current_year))
-        self.year_combo.currentTextChanged.connect(self.load_schedule)
+        # Combo index i holds self._years[i]; the selected year is tracked as
+        # an int so nothing has to parse the combo text
+        self._years = list(range(current_year, 2017, -1))
+        self.year_combo.addItems([str(year) for year in self._years])
+        self.year_combo.setCurrentIndex(0)
+        self._current_year = current_year
+        # Only fetch once the selection settles, not for every year scrolled past
+        self._year_debounce = QTimer(self)
+        self._year_debounce.setSingleShot(True)
+        self._year_debounce.setInterval(250)
+        self._year_debounce.timeout.connect(self._do_load_schedule)
+        self.year_combo.currentIndexChanged.connect(self.on_year_changed)
 
         year_layout.addWidget(year_label)
         year_layout.addWidget(self.year_combo)
@@ -193,17 +508,20 @@ class F1InsightHubLauncher(QMainWindow):
         # 3. Calendar & Sessions
         # ====================================================================
         content_layout = QHBoxLayout()
-        
+        content_layout.setContentsMargins(0, 0, 0, 0)
+
         calendar_group = QGroupBox("Race Calendar")
         calendar_layout = QVBoxLayout()
         
-        self.schedule_tree = QTreeWidget()
-        self.schedule_tree.setHeaderLabels(["Round", "Event", "Country", "Date"])
+        self.schedule_model = ScheduleModel(self)
+        self.schedule_tree = QTreeView()
+        self.schedule_tree.setModel(self.schedule_model)
+        self.schedule_tree.setUniformRowHeights(True)
         self.schedule_tree.setColumnWidth(0, 90)
         self.schedule_tree.setColumnWidth(1, 330)
         self.schedule_tree.setColumnWidth(2, 240)
         self.schedule_tree.setAlternatingRowColors(True)
-        self.schedule_tree.itemClicked.connect(self.on_event_selected)
+        self.schedule_tree.clicked.connect(self.on_event_selected)
         
         calendar_layout.addWidget(self.schedule_tree)
         calendar_group.setLayout(calendar_layout)
@@ -211,6 +529,7 @@ class F1InsightHubLauncher(QMainWindow):
         content_layout.addWidget(calendar_group, 3)
 
         right_panel_layout = QVBoxLayout()
+        right_panel_layout.setContentsMargins(0, 0, 0, 0)
         session_group = QGroupBox("Select Session Type")
         session_group.setStyleSheet("font-weight: bold;")
         
@@ -221,9 +540,8 @@ class F1InsightHubLauncher(QMainWindow):
         self.session_race.setChecked(True)
         self.session_sprint = QRadioButton("Sprint")
         
-        opt_style = "font-size: 14px;"
-        self.session_race.setStyleSheet(opt_style)
-        self.session_sprint.setStyleSheet(opt_style)
+        self.session_race.setFont(make_font(14))
+        self.session_sprint.setFont(make_font(14))
 
         session_layout.addWidget(self.session_race)
         session_layout.addWidget(self.session_sprint)
@@ -239,58 +557,28 @@ class F1InsightHubLauncher(QMainWindow):
         # 4. Big Square Module Buttons
         # ====================================================================
         buttons_layout = QHBoxLayout()
+        buttons_layout.setContentsMargins(0, 0, 0, 0)
         buttons_layout.setSpacing(20)
 
         # 1. Vision Module
         self.btn_vision = QPushButton("RaceVision")
         self.btn_vision.setFixedSize(370, 220)
         self.btn_vision.clicked.connect(self.launch_vision_module)
-        self.btn_vision.setStyleSheet('''
-            QPushButton {
-                background-color: #e10600;
-                color: white;
-                font-size: 46px;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #ff1e00;
-                border: 2px solid white;
-            }''')
+        self.btn_vision.setStyleSheet(MODULE_BUTTON_QSS)
 
         # 2. Analytics Module
         self.btn_analytics = QPushButton("RaceAnalytics")
         self.btn_analytics.setFixedSize(370, 220)
         self.btn_analytics.setEnabled(True)
         self.btn_analytics.clicked.connect(self.launch_analytics_module)
-        self.btn_analytics.setStyleSheet("""
-            QPushButton {
-                background-color: #e10600;
-                color: white;
-                font-size: 46px;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #ff1e00;
-                border: 2px solid white;
-            }""")
+        self.btn_analytics.setStyleSheet(MODULE_BUTTON_QSS)
 
         # 3. Intelligence Module (NEW ML UPDATE)
         self.btn_intelligence = QPushButton("RaceIntelligence")
         self.btn_intelligence.setFixedSize(370, 220)
         self.btn_intelligence.setEnabled(True) # Enabled!
         self.btn_intelligence.clicked.connect(self.launch_intelligence_module)
-        self.btn_intelligence.setStyleSheet("""
-            QPushButton {
-                background-color: #e10600;
-                color: white;
-                font-size: 46px;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background-color: #ff1e00;
-                border: 2px solid white;
-            }
-        """)
+        self.btn_intelligence.setStyleSheet(MODULE_BUTTON_QSS)
 
         buttons_layout.addStretch()
         buttons_layout.addWidget(self.btn_vision)
@@ -303,51 +591,153 @@ class F1InsightHubLauncher(QMainWindow):
 
         # Status bar
         self.status_label = QLabel("Ready. Select a race to begin analysis.")
-        self.status_label.setStyleSheet("""
-            padding: 8px; 
-            background-color: #e10600; 
-            font-size: 16px; 
-            color: white; 
-            border-radius: 4px;
-        """)
+        self.status_label.setStyleSheet(STATUS_LABEL_QSS)
         main_layout.addWidget(self.status_label)
 
-    def load_schedule(self):
-        year = int(self.year_combo.currentText())
-        self.status_label.setText(f"Loading {year} race calendar...")
-
-        self.worker = FetchScheduleWorker(year)
-        self.worker.result.connect(self.on_schedule_loaded)
-        self.worker.error.connect(self.on_schedule_error)
-        self.worker.start()
-
-    def on_schedule_loaded(self, events):
-        self.events_data = events
-        self.schedule_tree.clear()
-
-        for event in events:
-            item = QTreeWidgetItem(
-                [
-                    str(event["round_number"]),
-                    event["event_name"],
-                    event.get("country", "N/A"),
-                    event["date"],
-                    event["type"],
-                ]
-            )
-            item.setData(0, Qt.UserRole, event)
-            self.schedule_tree.addTopLevelItem(item)
+        self.setCentralWidget(central_widget)
+
+    def on_year_changed(self, index):
+        self._current_year = self._years[index]
+        self._year_debounce.start()
+
+    def _do_load_schedule(self):
+        year = self._current_year
+        if year == self._loaded_year:
+            # Already showing this calendar (e.g. scrolled away and back)
+            return
+        if year in self._schedule_cache:
+            # Seen before: no need for a round trip through the thread pool
+            self.on_schedule_loaded(year, self._schedule_cache[year])
+            return
+        cached = _read_schedule_cache(year)
+        if cached is not None:
+            events, fresh = cached
+            # Show the saved copy straight away; a stale one is still shown
+            # while the fetch below checks for changes
+            self.on_schedule_loaded(year, _schedule_payload(events))
+            if fresh:
+                return
+        else:
+            self.status_label.setText(f"Loading {year} race calendar...")
+
+        pool = self._fetch_pool
+        # A fetch for a year the user already left that hasn't started yet
+        # is dropped; one already running finishes but its result is ignored
+        if self._pending_fetch is not None:
+            pool.tryTake(self._pending_fetch)
+        self._pending_fetch = FetchScheduleTask(year, self.schedule_signals)
+        pool.start(self._pending_fetch)
+
+    def on_schedule_loaded(self, year, payload):
+        # A slower fetch for a year the user already moved away from
+        if year != self._current_year:
+            return
+
+        events, display = payload
+        if year == self._loaded_year and display == self._schedule_cache[year][1]:
+            # Refresh of the calendar already on screen with nothing new;
+            # keep the rows (and the user's selection) as they are
+            return
+        self._schedule_cache[year] = payload
+        self._loaded_year = year
+        self.events_data = list(events)
+        # Swapping the model's rows is a single reset, no per-row items
+        self.schedule_model.set_schedule(events, display)
 
         self.status_label.setText(
             f"Loaded {len(events)} races. Select an event to continue."
         )
 
-    def on_schedule_error(self, error_msg):
+        self.prefetch_adjacent_years()
+
+    def prefetch_adjacent_years(self):
+        year = self._current_year
+        for neighbour in (year - 1, year + 1):
+            if (
+                neighbour in self._years
+                and neighbour not in self._schedule_cache
+                and neighbour not in self._prefetching
+            ):
+                self._prefetching.add(neighbour)
+                self._prefetch_pool.start(
+                    PrefetchScheduleTask(neighbour, self.schedule_signals)
+                )
+
+    def on_schedule_prefetched(self, year, payload):
+        self._prefetching.discard(year)
+        if payload is not None:
+            self._schedule_cache.setdefault(year, payload)
+
+    def on_schedule_error(self, year, error_msg):
+        if year != self._current_year:
+            return
+        if year == self._loaded_year:
+            # Only the refresh of a saved calendar failed; keep showing it
+            print(f"Could not refresh the {year} schedule: {error_msg}")
+            return
         QMessageBox.critical(self, "Error", f"Failed to load schedule: {error_msg}")
         self.status_label.setText("Error loading schedule.")
 
-    def on_event_selected(self, item, column):
-        self.selected_event = item.data(0, Qt.UserRole)
+    def closeEvent(self, event):
+        # Drop queued fetches/prefetches and give running ones a moment
+        for pool in (self._fetch_pool, self._prefetch_pool):
+            pool.clear()
+            pool.waitForDone(2000)
+        # Closing stdin tells an idle module to exit without opening a window
+        for proc in self._warm_modules.values():
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+        self._warm_modules.clear()
+        super().closeEvent(event)
+
+    # ========================================================================
+    # MODULE PROCESSES
+    # ========================================================================
+
+    def _warm_up_modules(self):
+        for script in WARM_MODULES:
+            self._spawn_warm_module(script)
+
+    def _spawn_warm_module(self, script):
+        """Start `script --serve`; it imports everything and waits for a job."""
+        import subprocess
+
+        try:
+            self._warm_modules[script] = subprocess.Popen(
+                [sys.executable, script, "--serve"],
+                stdin=subprocess.PIPE,
+                **_SPAWN_KWARGS,
+            )
+        except OSError as e:
+            print(f"Could not pre-start {script}: {e}")
+
+    def _launch_module(self, script, args):
+        """Hand args to a warm module process, or start a fresh one."""
+        import subprocess
+
+        proc = self._warm_modules.pop(script, None)
+        sent = False
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.write(json.dumps(args).encode() + b"\n")
+                proc.stdin.close()
+                sent = True
+            except OSError:
+                pass
+        if not sent:
+            subprocess.Popen(
+                [sys.executable, script, *args],
+                stdin=subprocess.DEVNULL,
+                **_SPAWN_KWARGS,
+            )
+        # Keep one warm process per pre-started module kind for the next launch
+        if script in WARM_MODULES:
+            self._spawn_warm_module(script)
+
+    def on_event_selected(self, index):
+        self.selected_event = self.schedule_model.event_at(index.row())
         event_name = self.selected_event["event_name"]
         self.status_label.setText(
             f"Selected: {event_name}. Choose a session and launch a module."
@@ -359,34 +749,30 @@ class F1InsightHubLauncher(QMainWindow):
         else:
             return "R"
 
+    def _module_args(self, session_type):
+        """Command-line arguments shared by every module for the selection"""
+        return [
+            "--year", str(self._current_year),
+            "--round", str(self.selected_event["round_number"]),
+            "--session", session_type,
+        ]
+
     def launch_vision_module(self):
         if not self.selected_event:
             QMessageBox.warning(self, "No Event Selected", "Please select a race event first.")
             return
 
-        year = int(self.year_combo.currentText())
-        round_number = self.selected_event["round_number"]
         session_type = self.get_selected_session_type()
-        session_name = "Sprint" if session_type == "S" else "Race"
-
-        event_type = self.selected_event.get("type", "").lower()
-        if session_type == "S" and "sprint" not in event_type:
+        if session_type == "S" and not self.selected_event["has_sprint"]:
             self.status_label.setText(f"❌ Error: Sprint not available for {self.selected_event['event_name']}")
             return
 
-        self.status_label.setText(f"Loading {session_name} data for {self.selected_event['event_name']}...")
-        ready_file = os.path.join(tempfile.gettempdir(), f"f1hub_ready_{uuid.uuid4().hex}.tmp")
-
-        cmd = [
-            sys.executable,
-            "module_vision.py",
-            "--year", str(year),
-            "--round", str(round_number),
-            "--session", session_type,
-            "--ready-file", ready_file,
-        ]
+        self.status_label.setText(
+            f"Loading {SESSION_NAMES[session_type]} data for {self.selected_event['event_name']}..."
+        )
+        args = self._module_args(session_type)
         try:
-            subprocess.Popen(cmd)
+            self._launch_module("module_vision.py", args)
         except Exception as e:
             QMessageBox.critical(self, "Launch Error", f"Failed to launch Vision Module: {str(e)}")
 
@@ -395,21 +781,10 @@ class F1InsightHubLauncher(QMainWindow):
             QMessageBox.warning(self, "No Event Selected", "Please select a race event first.")
             return
 
-        year = int(self.year_combo.currentText())
-        round_number = self.selected_event["round_number"]
-        session_type = self.get_selected_session_type()
-
         self.status_label.setText(f"Launching Analytics for {self.selected_event['event_name']}...")
-
-        cmd = [
-            sys.executable,
-            "module_analytics.py",
-            "--year", str(year),
-            "--round", str(round_number),
-            "--session", session_type,
-        ]
+        args = self._module_args(self.get_selected_session_type())
         try:
-            subprocess.Popen(cmd)
+            self._launch_module("module_analytics.py", args)
         except Exception as e:
             QMessageBox.critical(self, "Launch Error", f"Failed to launch Analytics: {str(e)}")
 
@@ -419,27 +794,15 @@ class F1InsightHubLauncher(QMainWindow):
             QMessageBox.warning(self, "No Event Selected", "Please select a race event first.")
             return
 
-        year = int(self.year_combo.currentText())
-        round_number = self.selected_event["round_number"]
-        session_type = self.get_selected_session_type()
-
         self.status_label.setText(f"Launching Intelligence ML Suite for {self.selected_event['event_name']}...")
-
-        cmd = [
-            sys.executable,
-            "module_intelligence.py",
-            "--year", str(year),
-            "--round", str(round_number),
-            "--session", session_type,
-        ]
+        args = self._module_args(self.get_selected_session_type())
         try:
-            subprocess.Popen(cmd)
+            self._launch_module("module_intelligence.py", args)
         except Exception as e:
             QMessageBox.critical(self, "Launch Error", f"Failed to launch Intelligence Module: {str(e)}")
 
 
 def main():
-    enable_cache()
     app = QApplication(sys.argv)
     app.setStyle("Fusion") 
     launcher = F1InsightHubLauncher()
@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QLabel, QStackedWidget, QListWidget, QListWidgetItem, QFrame, 
     QGridLayout, QSplitter
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QFont, QColor, QIcon
 import matplotlib
 matplotlib.use('Qt5Agg')
@@ -27,7 +27,7 @@ matplotlib.rcParams['font.sans-serif'] = ['Jura', 'Arial', 'DejaVu Sans']
 from data_engine import load_session, enable_cache
 from config import (
     get_driver_color, TEAM_COLORS, 
-    format_time, format_speed
+    format_time, format_speed, serve_argv
 )
 
 # --- STYLING CONSTANTS ---
@@ -38,6 +38,37 @@ MENU_BG = "#F5F5F5"
 MENU_SEL_BG = "#e10600"
 MENU_SEL_TEXT = "#FFFFFF"
 
+# Timedelta columns that also get a float-seconds "<col>_s" twin after load
+SECTOR_COLUMNS = ('Sector1Time', 'Sector2Time', 'Sector3Time')
+TIMING_COLUMNS = ('LapTime', *SECTOR_COLUMNS)
+
+
+class SessionLoadSignals(QObject):
+    """Carries the loaded session (None on failure) back to the UI thread"""
+
+    loaded = Signal(object)
+
+
+class SessionLoadTask(QRunnable):
+    """Load a FastF1 session on the thread pool so the window stays responsive"""
+
+    def __init__(self, year, round_number, session_type, signals):
+        super().__init__()
+        self.year = year
+        self.round_number = round_number
+        self.session_type = session_type
+        self.signals = signals
+
+    def run(self):
+        session = None
+        try:
+            enable_cache()
+            session = load_session(self.year, self.round_number, self.session_type)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+        self.signals.loaded.emit(session)
+
+
 class AnalyticsWindow(QMainWindow):
     def __init__(self, year, round_number, session_type="R"):
         super().__init__()
@@ -51,13 +82,25 @@ class AnalyticsWindow(QMainWindow):
         self.session = None
         self.laps = None
         self.drivers_list = []
+        self._laps_by_driver = {}
+        self._drivers = ()
+        self._driver_arr = None
+        self._sector_arrs = {}
+        self._results = None       # session.results, None if missing/empty
+        self._fastest_lap = None   # session-wide pick_fastest(), None if none
+        self._driver_hex = {}
+        # Pace-plot inputs that are the same for every driver clicked
+        self._pace_threshold = 9999
+        self._leader_code = None
+        self._leader_pace = None
         
         # Setup UI
         self._setup_loading_ui()
         
-        # Load data immediately (blocking for simplicity, can be threaded)
+        # Load data in the background; the pages are built once it arrives
+        self._load_signals = SessionLoadSignals(self)
+        self._load_signals.loaded.connect(self._on_data_loaded, Qt.QueuedConnection)
         self._load_data()
-        self._setup_main_ui()
 
     def _setup_loading_ui(self):
         self.loading_label = QLabel("Loading Session Data...\nPlease Wait.")
@@ -66,16 +109,97 @@ class AnalyticsWindow(QMainWindow):
         self.setCentralWidget(self.loading_label)
 
     def _load_data(self):
+        QThreadPool.globalInstance().start(
+            SessionLoadTask(self.year, self.round, self.session_type, self._load_signals)
+        )
+
+    def _on_data_loaded(self, session):
+        self.session = session
         try:
-            enable_cache()
-            self.session = load_session(self.year, self.round, self.session_type)
             if self.session:
                 self.laps = self.session.laps
                 # Get list of drivers for the menu
                 if hasattr(self.session, 'drivers'):
                     self.drivers_list = self.session.drivers
+                self._index_laps()
+                self._precompute_pace_context()
         except Exception as e:
             print(f"Error loading data: {e}")
+        self._setup_main_ui()
+
+    def _index_laps(self):
+        """Lookups built once per session and shared by every page"""
+        # Low-cardinality string columns: compare/group on integer codes
+        self.laps = self.laps.assign(
+            Driver=self.laps['Driver'].astype('category'),
+            Compound=self.laps['Compound'].astype('category'),
+        )
+        # Timings as float seconds, converted once instead of on every page/click
+        self.laps = self.laps.assign(**{
+            f"{col}_s": self.laps[col].dt.total_seconds() for col in TIMING_COLUMNS
+        })
+        # One groupby pass instead of a pick_drivers() scan per driver
+        self._laps_by_driver = dict(
+            tuple(self.laps.groupby('Driver', sort=False, observed=True))
+        )
+        # Drivers with laps, in order of appearance
+        self._drivers = tuple(self._laps_by_driver)
+        # Plain arrays for per-lap lookups that don't need a pandas row
+        self._driver_arr = self.laps['Driver'].to_numpy()
+        self._sector_arrs = {
+            col: self.laps[f"{col}_s"].to_numpy() for col in SECTOR_COLUMNS
+        }
+        results = getattr(self.session, 'results', None)
+        self._results = results if results is not None and not results.empty else None
+        fastest_lap = self.laps.pick_fastest()
+        # Newer FastF1 returns an empty Lap rather than None if nothing qualifies
+        if fastest_lap is not None and pd.notna(fastest_lap.get('LapTime_s')):
+            self._fastest_lap = fastest_lap
+        codes = list(self._drivers)
+        if self._results is not None:
+            codes.extend(self._results['Abbreviation'])
+        self._driver_hex = {drv: self._format_hex(drv) for drv in codes}
+
+    def _precompute_pace_context(self):
+        """Slow-lap cutoff and the leader's reference line, once per session"""
+        if self._fastest_lap is not None:
+            self._pace_threshold = self._fastest_lap['LapTime_s'] * 1.15
+        if self._results is not None:
+            self._leader_code = self._results['Abbreviation'].iloc[0]
+
+        if self._leader_code:
+            leader_laps = self._driver_laps(self._leader_code)
+            # Leader's laps filtered with the same threshold so scales match
+            # (NaN lap times compare False, so they drop out too)
+            lap_s = leader_laps['LapTime_s'].to_numpy()
+            clean = lap_s < self._pace_threshold
+            if clean.any():
+                self._leader_pace = (leader_laps['LapNumber'].to_numpy()[clean], lap_s[clean])
+
+    def _top_speed(self, lap):
+        """Highest car-data speed on a lap, or None if telemetry isn't loaded"""
+        try:
+            # Car data alone has Speed; get_telemetry() would also merge in
+            # position data just to read one column
+            speed = lap.get_car_data()['Speed'].max()
+        except Exception as e:
+            print(f"Top speed unavailable: {e}")
+            return None
+        return int(speed) if pd.notna(speed) else None
+
+    def _format_hex(self, driver):
+        return '#%02x%02x%02x' % tuple(get_driver_color(driver, self.session))
+
+    def _driver_color(self, driver):
+        """Driver's colour as a '#rrggbb' string (cached per session)"""
+        color = self._driver_hex.get(driver)
+        if color is None:
+            color = self._driver_hex[driver] = self._format_hex(driver)
+        return color
+
+    def _driver_laps(self, driver):
+        laps = self._laps_by_driver.get(driver)
+        return laps if laps is not None else self.laps.iloc[0:0]
 
     def _setup_main_ui(self):
         if self.laps is None or self.laps.empty:
@@ -152,10 +276,17 @@ class AnalyticsWindow(QMainWindow):
         main_layout.addWidget(sidebar)
 
         # --- RIGHT CONTENT AREA ---
+        # Pages are built the first time they are shown; until then each
+        # slot holds an empty placeholder
         self.stack = QStackedWidget()
-        self.stack.addWidget(self._create_summary_tab())       # Index 0
-        self.stack.addWidget(self._create_fastest_laps_tab())  # Index 1
-        self.stack.addWidget(self._create_pace_tab())          # Index 2
+        self._page_builders = [
+            self._create_summary_tab,       # Index 0
+            self._create_fastest_laps_tab,  # Index 1
+            self._create_pace_tab,          # Index 2
+        ]
+        self._pages_built = [False] * len(self._page_builders)
+        for _ in self._page_builders:
+            self.stack.addWidget(QWidget())
         
         main_layout.addWidget(self.stack)
 
@@ -163,6 +294,14 @@ class AnalyticsWindow(QMainWindow):
         self.menu_list.setCurrentRow(0)
 
     def switch_page(self, row):
+        if 0 <= row < len(self._pages_built) and not self._pages_built[row]:
+            # Build first: if the builder raises, the placeholder keeps its slot
+            page = self._page_builders[row]()
+            placeholder = self.stack.widget(row)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stack.insertWidget(row, page)
+            self._pages_built[row] = True
         self.stack.setCurrentIndex(row)
 
     # ------------------------------------------------------------------------
@@ -203,73 +342,67 @@ class AnalyticsWindow(QMainWindow):
             card_layout.addWidget(lbl_sub)
             return card
 
+        def na_card(title, row, col):
+            grid.addWidget(create_card(title, "N/A", "", "#999"), row, col)
+
         # 1. Winner
-        try:
-            if hasattr(self.session, 'results') and not self.session.results.empty:
-                winner = self.session.results.iloc[0]
-                name = winner['Abbreviation']
-                team = winner['TeamName']
-                color = f"#{''.join([f'{c:02x}' for c in get_driver_color(name, self.session)])}"
-                grid.addWidget(create_card("Race Winner", name, team, color), 0, 0)
-        except:
-            grid.addWidget(create_card("Race Winner", "N/A", "", "#999"), 0, 0)
+        if self._results is not None:
+            winner = self._results.iloc[0]
+            name = winner['Abbreviation']
+            team = winner['TeamName']
+            color = self._driver_color(name)
+            grid.addWidget(create_card("Race Winner", name, team, color), 0, 0)
+        else:
+            na_card("Race Winner", 0, 0)
 
         # 2. Fastest Lap
-        try:
-            fl = self.laps.pick_fastest()
-            if fl is not None:
-                driver = fl['Driver']
-                time_str = format_time(fl['LapTime'].total_seconds())
-                color = f"#{''.join([f'{c:02x}' for c in get_driver_color(driver, self.session)])}"
-                grid.addWidget(create_card("Fastest Lap", time_str, driver, color), 0, 1)
-        except:
-            grid.addWidget(create_card("Fastest Lap", "N/A", "", "#999"), 0, 1)
+        fl = self._fastest_lap
+        if fl is not None:
+            driver = fl['Driver']
+            time_str = format_time(fl['LapTime_s'])
+            color = self._driver_color(driver)
+            grid.addWidget(create_card("Fastest Lap", time_str, driver, color), 0, 1)
+        else:
+            na_card("Fastest Lap", 0, 1)
 
         # 3. Top Speed
-        try:
-            if fl is not None:
-                tel = fl.get_telemetry()
-                top_speed = int(tel['Speed'].max())
-                grid.addWidget(create_card("Top Speed", f"{top_speed} km/h", f"{fl['Driver']} (Main Straight)", "#333"), 0, 2)
-        except:
-            grid.addWidget(create_card("Top Speed", "N/A", "", "#999"), 0, 2)
+        top_speed = self._top_speed(fl) if fl is not None else None
+        if top_speed is not None:
+            grid.addWidget(create_card("Top Speed", f"{top_speed} km/h", f"{fl['Driver']} (Main Straight)", "#333"), 0, 2)
+        else:
+            na_card("Top Speed", 0, 2)
 
         # 4. Most Used Tyre
-        try:
-            # Calculate mode of compound
-            tyre_counts = self.laps['Compound'].value_counts()
-            if not tyre_counts.empty:
-                most_used = tyre_counts.index[0]
-                count = tyre_counts.iloc[0]
-                grid.addWidget(create_card("Dominant Tyre", most_used, f"{count} Laps total", "#555"), 1, 0)
-        except:
-            grid.addWidget(create_card("Dominant Tyre", "N/A", "", "#999"), 1, 0)
+        tyre_counts = self.laps['Compound'].value_counts()
+        if not tyre_counts.empty and tyre_counts.iloc[0] > 0:
+            most_used = tyre_counts.index[0]
+            count = tyre_counts.iloc[0]
+            grid.addWidget(create_card("Dominant Tyre", most_used, f"{count} Laps total", "#555"), 1, 0)
+        else:
+            na_card("Dominant Tyre", 1, 0)
 
         # 5. Sector Fastest (S1, S2, S3)
         sectors = [('Sector1Time', 'Fastest Sector 1'), ('Sector2Time', 'Fastest Sector 2'), ('Sector3Time', 'Fastest Sector 3')]
         col_idx = 1
         row_idx = 1
-        
+
         for col_name, title in sectors:
-            try:
-                # Find row with min time for this sector
-                # We need to drop NaNs first
-                valid_laps = self.laps.dropna(subset=[col_name])
-                if not valid_laps.empty:
-                    best_sec = valid_laps.loc[valid_laps[col_name].idxmin()]
-                    sec_time = best_sec[col_name].total_seconds()
-                    driver = best_sec['Driver']
-                    color = f"#{''.join([f'{c:02x}' for c in get_driver_color(driver, self.session)])}"
-                    
-                    grid.addWidget(create_card(title, format_time(sec_time), driver, color), row_idx, col_idx)
-                
-                # Layout logic for 3 columns
-                col_idx += 1
-                if col_idx > 2:
-                    col_idx = 0
-                    row_idx += 1
-            except:
-                continue
+            # Fastest lap of the sector straight off the arrays (NaNs are
+            # skipped; a sector with no times at all gets no card)
+            sec = self._sector_arrs[col_name]
+            if not np.isnan(sec).all():
+                i = np.nanargmin(sec)
+                sec_time = sec[i]
+                driver = self._driver_arr[i]
+                color = self._driver_color(driver)
+
+                grid.addWidget(create_card(title, format_time(sec_time), driver, color), row_idx, col_idx)
+
+            # Layout logic for 3 columns
+            col_idx += 1
+            if col_idx > 2:
+                col_idx = 0
+                row_idx += 1
 
         layout.addLayout(grid)
         layout.addStretch()
@@ -286,26 +419,25 @@ class AnalyticsWindow(QMainWindow):
         canvas = FigureCanvas(Figure(figsize=(10, 6)))
         ax = canvas.figure.subplots()
 
-        drivers = pd.unique(self.laps['Driver'])
-        fastest_laps = []
-
-        for drv in drivers:
-            dr_laps = self.laps.pick_drivers(drv)
-            if not dr_laps.empty:
-                fl = dr_laps.pick_fastest()
-                if fl is not None and pd.notna(fl['LapTime']):
-                    fastest_laps.append({
-                        'Driver': drv,
-                        'LapTime': fl['LapTime'].total_seconds(),
-                        'Color': f"#{''.join([f'{c:02x}' for c in get_driver_color(drv, self.session)])}"
-                    })
-
-        if fastest_laps:
-            df = pd.DataFrame(fastest_laps).sort_values('LapTime')
-            p1_time = df.iloc[0]['LapTime']
-            df['Delta'] = df['LapTime'] - p1_time
-
-            bars = ax.bar(df['Driver'], df['Delta'], color=df['Color'])
+        # Each driver's pick_fastest() in one groupby: the quickest of their
+        # personal-best laps (deleted laps are never personal bests)
+        pb_laps = self.laps[self.laps['IsPersonalBest'] == True]
+        best = (
+            pb_laps['LapTime_s']
+            .groupby(pb_laps['Driver'], sort=False, observed=True).min()
+            .dropna()
+        )
+
+        if not best.empty:
+            # Sort plain arrays rather than building a DataFrame to sort
+            times = best.to_numpy()
+            order = np.argsort(times, kind='stable')
+            drivers = best.index.to_numpy()[order]
+            delta = times[order] - times[order[0]]
+            # Every driver with laps was coloured in _index_laps()
+            colors = [self._driver_hex[drv] for drv in drivers]
+
+            bars = ax.bar(drivers, delta, color=colors)
             ax.set_title("Fastest Lap Delta", fontsize=14, fontweight='bold')
             ax.set_ylabel("Gap to P1 (s)")
             ax.grid(axis='y', linestyle='--', alpha=0.3)
@@ -350,20 +482,16 @@ class AnalyticsWindow(QMainWindow):
             QListWidget::item:selected { background-color: #e10600; color: white; }
         """)
         
-        drivers_to_show = []
-        try:
-            # Try to get results to sort by position
-            if hasattr(self.session, 'results') and not self.session.results.empty:
-                for drv_code in self.session.results['Abbreviation']:
-                    drivers_to_show.append(drv_code)
-            else:
-                # Fallback to unsorted unique drivers from laps
-                drivers_to_show = sorted(pd.unique(self.laps['Driver']))
-        except:
-             drivers_to_show = sorted(pd.unique(self.laps['Driver']))
+        if self._results is not None:
+            # Results order, i.e. by finishing position
+            drivers_to_show = list(self._results['Abbreviation'])
+        else:
+            # Fallback to unsorted unique drivers from laps
+            drivers_to_show = sorted(self._drivers)
 
-        for drv in drivers_to_show:
-            self.driver_list_widget.addItem(drv)
+        # One batch insert; the list isn't shown or connected yet, so there
+        # are no signals or repaints to hold off
+        self.driver_list_widget.addItems([str(drv) for drv in drivers_to_show])
 
         self.driver_list_widget.itemClicked.connect(self._update_pace_plot)
         p_layout.addWidget(self.driver_list_widget)
@@ -377,6 +505,7 @@ class AnalyticsWindow(QMainWindow):
 
         self.pace_canvas = FigureCanvas(Figure(figsize=(10, 6)))
         self.pace_ax = self.pace_canvas.figure.subplots()
+        self._init_pace_artists()
         
         g_layout.addWidget(self.pace_canvas)
         splitter.addWidget(graph_panel)
@@ -388,97 +517,125 @@ class AnalyticsWindow(QMainWindow):
 
         return page
 
+    def _init_pace_artists(self):
+        """Axes styling and the artists every pace-plot click reuses"""
+        ax = self.pace_ax
+        ax.set_xlabel("Lap Number")
+        ax.set_ylabel("Lap Time (s)")
+        ax.grid(True, linestyle='--', alpha=0.3)
+
+        self._leader_line, = ax.plot(
+            [], [],
+            color='#999999',       # Grey color
+            linestyle='--',        # Dotted/Dashed
+            linewidth=1.5,
+            alpha=0.7,
+            visible=False,
+        )
+        self._driver_line, = ax.plot(
+            [], [],
+            marker='o',
+            markersize=4,
+            linestyle='-',
+            linewidth=2,
+            visible=False,
+        )
+        # Centred in axes coordinates, whatever the current data limits
+        self._pace_message = ax.text(0.5, 0.5, "", ha='center', transform=ax.transAxes)
+        # Stint markers (vertical line + compound label), grown on demand
+        self._stint_lines = []
+        self._stint_labels = []
+
+    def _stint_marker(self, i):
+        if i == len(self._stint_lines):
+            self._stint_lines.append(self.pace_ax.axvline(x=0, linestyle=':', alpha=0.4))
+            self._stint_labels.append(self.pace_ax.text(
+                0, 0, "", rotation=90, verticalalignment='bottom', fontsize=8, color='#333'
+            ))
+        return self._stint_lines[i], self._stint_labels[i]
+
     def _update_pace_plot(self, item):
         driver = item.text()
-        self.pace_ax.clear()
+        ax = self.pace_ax
+
+        threshold = self._pace_threshold
+        leader_code = self._leader_code
+        message = ""
+        stints = ()
+
+        # Leader Comparison (Dotted Line)
+        show_leader = self._leader_pace is not None and driver != leader_code
+        if show_leader:
+            self._leader_line.set_data(*self._leader_pace)
+            self._leader_line.set_label(f"Leader ({leader_code})")
+        self._leader_line.set_visible(show_leader)
+
+        # Selected Driver (Solid Line)
+        drv_laps = self._driver_laps(driver)
+        show_driver = False
 
-        
-        threshold = 9999
-        try:
-            fastest_lap = self.laps.pick_fastest()
-            if fastest_lap is not None:
-                fastest_time = fastest_lap['LapTime'].total_seconds()
-                threshold = fastest_time * 1.15
-        except:
-            pass
-
-        # 2. Identify the Race Leader (Winner)
-        leader_code = None
-        try:
-            if hasattr(self.session, 'results') and not self.session.results.empty:
-                leader_code = self.session.results.iloc[0]['Abbreviation']
-        except:
-            pass
-
-        # 3. Plot Leader Comparison (Dotted Line)
-        if leader_code and driver != leader_code:
-            leader_laps = self.laps.pick_drivers(leader_code)
-            if not leader_laps.empty:
-                leader_laps = leader_laps.dropna(subset=['LapTime'])
-                # Filter leader's laps using same threshold so scales match
-                clean_leader = leader_laps[leader_laps['LapTime'].dt.total_seconds() < threshold]
-                
-                if not clean_leader.empty:
-                    lx = clean_leader['LapNumber']
-                    ly = clean_leader['LapTime'].dt.total_seconds()
-                    
-                    self.pace_ax.plot(
-                        lx, ly, 
-                        color='#999999',       # Grey color
-                        linestyle='--',        # Dotted/Dashed
-                        linewidth=1.5, 
-                        alpha=0.7, 
-                        label=f"Leader ({leader_code})"
-                    )
-
-        # 4. Plot Selected Driver (Solid Line)
-        drv_laps = self.laps.pick_drivers(driver)
-        
         if not drv_laps.empty:
-            drv_laps = drv_laps.dropna(subset=['LapTime'])
-            # Filter slow laps
-            clean_drv = drv_laps[drv_laps['LapTime'].dt.total_seconds() < threshold]
-            
-            if not clean_drv.empty:
-                x = clean_drv['LapNumber']
-                y = clean_drv['LapTime'].dt.total_seconds()
-                
+            # Filter slow laps (and, as NaN compares False, missing times)
+            lap_s = drv_laps['LapTime_s'].to_numpy()
+            clean = lap_s < threshold
+
+            if clean.any():
+                laps_x = drv_laps['LapNumber'].to_numpy()[clean]
                 # Get Team Color
-                color = f"#{''.join([f'{c:02x}' for c in get_driver_color(driver, self.session)])}"
-                
-                self.pace_ax.plot(
-                    x, y, 
-                    color=color, 
-                    marker='o', 
-                    markersize=4, 
-                    linestyle='-', 
-                    linewidth=2, 
-                    label=driver
-                )
-                
-                stint_changes = clean_drv.loc[clean_drv['Compound'] != clean_drv['Compound'].shift(1)]
-                
-                for idx, row in stint_changes.iterrows():
-                    lap = row['LapNumber']
-                    compound = row['Compound']
-                    # Draw a vertical line for the pit stop/change
-                    self.pace_ax.axvline(x=lap, color=color, linestyle=':', alpha=0.4)
-                    self.pace_ax.text(lap, self.pace_ax.get_ylim()[0], f" {compound}", 
-                                    rotation=90, verticalalignment='bottom', fontsize=8, color='#333')
+                color = self._driver_color(driver)
+                self._driver_line.set_data(laps_x, lap_s[clean])
+                self._driver_line.set_color(color)
+                self._driver_line.set_label(driver)
+                show_driver = True
+
+                # First lap of each run of the same compound, compared on the
+                # categorical codes
+                codes = drv_laps['Compound'].cat.codes.to_numpy()[clean]
+                stint_start = np.empty(len(codes), dtype=bool)
+                stint_start[0] = True
+                stint_start[1:] = codes[1:] != codes[:-1]
+                compounds = drv_laps['Compound'].to_numpy()[clean]
+                stints = zip(laps_x[stint_start], compounds[stint_start])
             else:
-                 self.pace_ax.text(0.5, 0.5, "No Representative Lap Data (Too Slow/DNF)", ha='center')
-
-            # Graph Styling
-            self.pace_ax.set_title(f"Pace Comparison: {driver} vs Leader", fontsize=14, fontweight='bold')
-            self.pace_ax.set_xlabel("Lap Number")
-            self.pace_ax.set_ylabel("Lap Time (s)")
-            self.pace_ax.grid(True, linestyle='--', alpha=0.3)
-            self.pace_ax.legend()
-            
-        else:
-            self.pace_ax.text(0.5, 0.5, "No Data for Driver", ha='center')
+                message = "No Representative Lap Data (Too Slow/DNF)"
 
-        self.pace_canvas.draw()
+            ax.set_title(f"Pace Comparison: {driver} vs Leader", fontsize=14, fontweight='bold')
+        else:
+            message = "No Data for Driver"
+            ax.set_title("")
+
+        self._driver_line.set_visible(show_driver)
+        # Hidden lines keep an underscore label so the legend skips them
+        if not show_leader:
+            self._leader_line.set_label("_leader")
+        if not show_driver:
+            self._driver_line.set_label("_driver")
+        self._pace_message.set_text(message)
+        for line, label in zip(self._stint_lines, self._stint_labels):
+            line.set_visible(False)
+            label.set_visible(False)
+
+        # Rescale to the lap-time lines only, then place the stint markers
+        ax.relim(visible_only=True)
+        ax.autoscale_view()
+
+        # Draw a vertical line for each pit stop/compound change
+        y_bottom = ax.get_ylim()[0]
+        for i, (lap, compound) in enumerate(stints):
+            line, label = self._stint_marker(i)
+            line.set_xdata([lap, lap])
+            line.set_color(color)
+            line.set_visible(True)
+            label.set_position((lap, y_bottom))
+            label.set_text(f" {compound}")
+            label.set_visible(True)
+
+        if not drv_laps.empty and (show_leader or show_driver):
+            ax.legend()
+        elif ax.get_legend() is not None:
+            ax.get_legend().remove()
+
+        self.pace_canvas.draw_idle()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -487,7 +644,11 @@ if __name__ == "__main__":
     parser.add_argument("--year", type=int, required=True)
     parser.add_argument("--round", type=int, required=True)
     parser.add_argument("--session", type=str, default="R")
-    args = parser.parse_args()
+    parser.add_argument("--serve", action="store_true", help="Wait for the arguments as a JSON list on stdin")
+    # Set up the FastF1 cache now; with --serve this happens while the
+    # module is still waiting for its job
+    enable_cache()
+    args = parser.parse_args(serve_argv())
 
     window = AnalyticsWindow(args.year, args.round, args.session)
     window.show()
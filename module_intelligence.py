@@ -27,7 +27,7 @@ matplotlib.rcParams['font.sans-serif'] = ['Jura', 'Arial', 'DejaVu Sans']
 
 # Project imports
 from data_engine import load_session, enable_cache
-from config import get_driver_color
+from config import get_driver_color, serve_argv
 
 # --- STYLING CONSTANTS ---
 BG_COLOR = "#FFFFFF"
@@ -432,7 +432,8 @@ if __name__ == "__main__":
     parser.add_argument("--year", type=int, required=True)
     parser.add_argument("--round", type=int, required=True)
     parser.add_argument("--session", type=str, default="R")
-    args = parser.parse_args()
+    parser.add_argument("--serve", action="store_true", help="Wait for the arguments as a JSON list on stdin")
+    args = parser.parse_args(serve_argv())
 
     window = IntelligenceWindow(args.year, args.round, args.session)
     window.show()
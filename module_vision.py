@@ -4,13 +4,22 @@
 
 import os
 import sys
+import math
 import arcade
 import arcade.color
+import pyglet
+import pyglet.shapes
 import numpy as np
 import argparse
+from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict, Any
 import time
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from config import (
     FPS,
     SCREEN_WIDTH,
@@ -24,6 +33,7 @@ from config import (
     format_time,
     get_tyre_color,
     get_tyre_compound_str,
+    serve_argv,
 )
 from data_engine import (
     enable_cache,
@@ -39,6 +49,24 @@ from data_engine import (
 # ============================================================================
 
 
+def _place_text(text: arcade.Text, x: float, y: float):
+    """Move a cached Text only when its position actually changed"""
+    if text.position != (x, y):
+        text.position = (x, y)
+
+
+def _update_shape(shape, **props):
+    """Assign only the shape properties that changed (every setter rewrites vertex data)"""
+    for name, value in props.items():
+        if getattr(shape, name) != value:
+            setattr(shape, name, value)
+
+
+def _ordered_groups(count: int) -> List[pyglet.graphics.Group]:
+    """Batch groups drawn back to front, so overlapping shapes keep their paint order"""
+    return [pyglet.graphics.Group(order=i) for i in range(count)]
+
+
 class BaseComponent:
     """Base class for all UI components"""
 
@@ -73,9 +101,140 @@ class LeaderboardComponent(BaseComponent):
         self.header_height = 40
         self.padding = 10
 
+        self._row_pool: List[Dict[str, Any]] = []
+
+        # Struct-of-arrays view of the current entries (filled by set_entries)
+        self._positions: List[Any] = []
+        self._drivers: List[str] = []
+        self._colors: List[Tuple] = []
+        self._tyres: List[int] = []
+        self._leader_lap = 0
+
+        # Panel shapes and labels share one batch and are only moved when the
+        # layout changes; labels sit on the top layer above the tyre icons
+        self._batch = pyglet.graphics.Batch()
+        self._layers = _ordered_groups(5)
+        self._title_text = arcade.Text(
+            "LEADERBOARD", 0, 0, arcade.color.WHITE, 14,
+            bold=True, italic=True, anchor_y="center",
+            batch=self._batch, group=self._layers[4],
+        )
+        self._lap_text = arcade.Text(
+            "", 0, 0, arcade.color.LIGHT_GRAY, 12,
+            bold=True, anchor_x="right", anchor_y="center",
+            batch=self._batch, group=self._layers[4],
+        )
+        self._panel = pyglet.shapes.Rectangle(
+            0, 0, width, 0, (20, 20, 25, 220), batch=self._batch, group=self._layers[0]
+        )
+        self._panel_outline = pyglet.shapes.Box(
+            0, 0, width + 1, 0, thickness=1, color=(255, 255, 255, 40),
+            batch=self._batch, group=self._layers[1],
+        )
+        self._accent_bar = pyglet.shapes.Rectangle(
+            0, 0, 4, 24, (255, 40, 40), batch=self._batch, group=self._layers[1]
+        )
+        self._layout_key = None
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        """Return the cached Text objects and shapes for row i, creating them on first use"""
+        labels = {"batch": self._batch, "group": self._layers[4]}
+        while len(self._row_pool) <= i:
+            pos_color = arcade.color.GOLD if not self._row_pool else arcade.color.WHITE
+            self._row_pool.append(
+                {
+                    "pos": arcade.Text("", 0, 0, pos_color, 11, bold=True, anchor_y="center", **labels),
+                    "driver": arcade.Text(
+                        "", 0, 0, arcade.color.WHITE, 12, bold=True, anchor_y="center", **labels
+                    ),
+                    "tyre": arcade.Text(
+                        "", 0, 0, arcade.color.WHITE, 10,
+                        bold=True, anchor_x="center", anchor_y="center", **labels,
+                    ),
+                    "stripe": pyglet.shapes.Rectangle(
+                        0, 0, self.width - 4, self.row_height - 2, (255, 255, 255, 10),
+                        batch=self._batch, group=self._layers[1],
+                    ),
+                    "tyre_bg": pyglet.shapes.Circle(
+                        0, 0, 12, segments=12, color=(10, 10, 10),
+                        batch=self._batch, group=self._layers[2],
+                    ),
+                    "tyre_ring": pyglet.shapes.Arc(
+                        0, 0, 9.5, segments=9, thickness=2,
+                        batch=self._batch, group=self._layers[3],
+                    ),
+                }
+            )
+        return self._row_pool[i]
+
     def set_entries(self, entries: List[Dict[str, Any]]):
         self.entries = entries
 
+        # Unpack the rows into parallel columns once; draw() and the change
+        # checks work on these instead of per-row dict lookups
+        positions = [entry.get("position", 0) for entry in entries]
+        drivers = [entry.get("driver", "???") for entry in entries]
+        colors = [entry.get("color", arcade.color.WHITE) for entry in entries]
+        tyres = [entry.get("tyre", -1) for entry in entries]
+        self._leader_lap = int(entries[0].get("lap", 0)) if entries else 0
+
+        if (positions, drivers, colors, tyres) != (
+            self._positions, self._drivers, self._colors, self._tyres
+        ):
+            self._update_rows(positions, drivers, colors, tyres)
+        self._positions = positions
+        self._drivers = drivers
+        self._colors = colors
+        self._tyres = tyres
+
+    def _update_rows(self, positions, drivers, colors, tyres):
+        """Rewrite the cached labels and tyre rings of the rows whose values changed"""
+        shown = len(self._positions)
+        for i in range(len(positions)):
+            row = self._row(i)
+            stale = i >= shown
+            if stale or positions[i] != self._positions[i]:
+                row["pos"].text = f"P{positions[i]}"
+            if stale or drivers[i] != self._drivers[i]:
+                row["driver"].text = drivers[i].upper()
+            if stale or colors[i] != self._colors[i]:
+                row["driver"].color = colors[i]
+            if stale or tyres[i] != self._tyres[i]:
+                tyre_str = get_tyre_compound_str(tyres[i])
+                row["tyre"].text = tyre_str[:1]
+                row["tyre_ring"].color = get_tyre_color(tyre_str)
+
+    def _layout(self, top_y: float):
+        """Move the panel shapes and row objects after a resize or a change in row count"""
+        total_height = self.header_height + len(self.entries) * self.row_height + 10
+        bottom_y = top_y - total_height
+
+        self._panel.position = (self.x, bottom_y)
+        self._panel.height = total_height
+        self._panel_outline.position = (self.x - 0.5, bottom_y - 0.5)
+        self._panel_outline.height = total_height + 1
+        self._accent_bar.position = (self.x + 2, top_y - 32)
+
+        _place_text(self._title_text, self.x + 18, top_y - 20)
+        # Right align with some padding
+        _place_text(self._lap_text, self.x + self.width - 15, top_y - 20)
+
+        list_top_y = top_y - self.header_height
+        tyre_x = self.x + self.width - 30
+        for i, row in enumerate(self._row_pool):
+            row_y = list_top_y - (i * self.row_height) - (self.row_height / 2)
+            shown = i < len(self.entries)
+
+            row["stripe"].position = (self.x + 2, row_y - (self.row_height - 2) / 2)
+            row["tyre_bg"].position = (tyre_x, row_y)
+            row["tyre_ring"].position = (tyre_x, row_y)
+            for key in ("tyre_bg", "tyre_ring", "pos", "driver", "tyre"):
+                row[key].visible = shown
+
+            _place_text(row["pos"], self.x + 10, row_y)
+            _place_text(row["driver"], self.x + 45, row_y)
+            _place_text(row["tyre"], tyre_x, row_y)
+
     def on_resize(self, window):
         """Dynamic positioning relative to window edge"""
         self.x = max(20, window.width - UI_RIGHT_MARGIN + 12)
@@ -84,118 +243,32 @@ class LeaderboardComponent(BaseComponent):
         if not self.visible or not self.entries:
             return
 
-        # 1. Calculate Layout Constants
+        # 1. Re-layout only when the window or the number of rows changed
         top_y = window.height - 60
-        content_height = len(self.entries) * self.row_height
-        total_height = self.header_height + content_height + 10
-
-        center_x = self.x + (self.width / 2)
-        center_y = top_y - (total_height / 2)
-
-        # 2. Draw Background Panel
-        panel_rect = arcade.rect.XYWH(center_x, center_y, self.width, total_height)
-        arcade.draw_rect_filled(panel_rect, (20, 20, 25, 220))
-        arcade.draw_rect_outline(panel_rect, (255, 255, 255, 40), border_width=1)
-
-        # 3. Draw Header
-        header_y = top_y - 20
-        
-        # Red Accent Bar
-        arcade.draw_rect_filled(
-            arcade.rect.XYWH(self.x + 4, header_y, 4, 24), (255, 40, 40)
-        )
-        
-        # Title "LEADERBOARD"
-        arcade.draw_text(
-            "LEADERBOARD",
-            self.x + 18,
-            header_y,
-            arcade.color.WHITE,
-            14,
-            bold=True,
-            italic=True,
-            anchor_y="center",
-        )
-
-        # --- NEW: Draw Lap Count (Right Aligned) ---
-        if self.entries:
-            # Get lap from the leader (index 0)
-            current_lap = int(self.entries[0].get("lap", 0))
-            # Ensure it doesn't exceed total (visual fix for finish line)
-            display_lap = min(current_lap, self.total_laps)
-            
-            lap_text = f"LAP {display_lap}/{self.total_laps}"
-            
-            arcade.draw_text(
-                lap_text,
-                self.x + self.width - 15,  # Right align with some padding
-                header_y,
-                arcade.color.LIGHT_GRAY,   # Subtle gray color
-                12,
-                bold=True,
-                anchor_x="right",
-                anchor_y="center",
-            )
-
-        # 4. Draw Rows
-        list_top_y = top_y - self.header_height
-
-        for i, entry in enumerate(self.entries):
-            row_y = list_top_y - (i * self.row_height) - (self.row_height / 2)
-
-            driver = entry.get("driver", "???")
-            driver_color = entry.get("color", arcade.color.WHITE)
-            tyre_str = get_tyre_compound_str(entry.get("tyre", -1))
-            tyre_color = get_tyre_color(tyre_str)
-
-            # Highlight Selection or Zebra Striping
+        layout_key = (self.x, top_y, len(self.entries))
+        if layout_key != self._layout_key:
+            self._layout(top_y)
+            self._layout_key = layout_key
+
+        # 2. Highlight Selection or Zebra Striping
+        for i, driver in enumerate(self._drivers):
+            stripe = self._row_pool[i]["stripe"]
             if driver in self.selected_drivers:
-                row_rect = arcade.rect.XYWH(
-                    center_x, row_y, self.width - 4, self.row_height - 2
-                )
-                arcade.draw_rect_filled(row_rect, (225, 6, 0, 80))
+                _update_shape(stripe, visible=True, color=(225, 6, 0, 80))
             elif i % 2 == 0:
-                row_rect = arcade.rect.XYWH(
-                    center_x, row_y, self.width - 4, self.row_height - 2
-                )
-                arcade.draw_rect_filled(row_rect, (255, 255, 255, 10))
-
-            # Position
-            arcade.draw_text(
-                f"P{entry.get('position', 0)}",
-                self.x + 10,
-                row_y,
-                arcade.color.GOLD if i == 0 else arcade.color.WHITE,
-                11,
-                bold=True,
-                anchor_y="center",
-            )
+                _update_shape(stripe, visible=True, color=(255, 255, 255, 10))
+            else:
+                _update_shape(stripe, visible=False)
+        for row in self._row_pool[len(self.entries):]:
+            _update_shape(row["stripe"], visible=False)
 
-            # Driver Name
-            arcade.draw_text(
-                driver.upper(),
-                self.x + 45,
-                row_y,
-                driver_color,
-                12,
-                bold=True,
-                anchor_y="center",
-            )
+        # 3. Header: lap of the leader (index 0); ensure it doesn't exceed total
+        # (visual fix for finish line)
+        display_lap = min(self._leader_lap, self.total_laps)
+        self._lap_text.text = f"LAP {display_lap}/{self.total_laps}"
 
-            # Tyre Icon
-            tyre_x = self.x + self.width - 30
-            arcade.draw_circle_filled(tyre_x, row_y, 12, (10, 10, 10))
-            arcade.draw_circle_outline(tyre_x, row_y, 9.5, tyre_color, border_width=2)
-            arcade.draw_text(
-                tyre_str[:1],
-                tyre_x,
-                row_y,
-                arcade.color.WHITE,
-                10,
-                bold=True,
-                anchor_x="center",
-                anchor_y="center",
-            )
+        # 4. Panel, stripes, tyre icons and labels in a single batch
+        self._batch.draw()
 
     def on_mouse_press(self, window, x: float, y: float, button: int, modifiers: int) -> bool:
         if not self.visible or not self.entries:
@@ -204,39 +277,97 @@ class LeaderboardComponent(BaseComponent):
         if not (self.x <= x <= self.x + self.width):
             return False
 
+        # Rows are fixed-height stripes below the header, so the clicked row is
+        # computed directly; a click on the line between two rows picks the upper one
         list_start_y = window.height - 60 - self.header_height
+        offset = list_start_y - y
+        if offset < 0:
+            return False
 
-        for i, entry in enumerate(self.entries):
-            row_top = list_start_y - (i * self.row_height)
-            row_bottom = row_top - self.row_height
-
-            if row_bottom <= y <= row_top:
-                driver = entry.get("driver")
-                if driver:
-                    was_selected = driver in self.selected_drivers
-                    self.selected_drivers.clear()
-                    if not was_selected:
-                        self.selected_drivers.add(driver)
-                return True
+        row = max(0, math.ceil(offset / self.row_height) - 1)
+        if row >= len(self.entries):
+            return False
 
-        return False
+        driver = self.entries[row].get("driver")
+        if driver:
+            was_selected = driver in self.selected_drivers
+            self.selected_drivers.clear()
+            if not was_selected:
+                self.selected_drivers.add(driver)
+        return True
 
 
 class WeatherComponent(BaseComponent):
     """Display weather information"""
 
+    # Readouts in panel order; missing keys are skipped
+    READOUTS = (
+        ("air_temp", "Air: {:.1f}°C"),
+        ("track_temp", "Track: {:.1f}°C"),
+        ("humidity", "Humidity: {:.0f}%"),
+        ("wind_speed", "Wind: {:.1f} km/h"),
+    )
+
     def __init__(self, left: int = 20, top_offset: int = 170, visible: bool = True):
         self.left = left
         self.top_offset = top_offset
         self.visible = visible
         self.weather_data = None
 
+        # Background and text are laid out once per change and drawn as one batch;
+        # only the animated icon is drawn immediately
+        self._batch = pyglet.graphics.Batch()
+        layers = _ordered_groups(2)
+        self._panel = pyglet.shapes.Rectangle(
+            left, 0, 200, 120, (40, 40, 45, 200), batch=self._batch, group=layers[0]
+        )
+        self._header_text = arcade.Text(
+            "WEATHER", left + 10, 0, arcade.color.WHITE, 12,
+            bold=True, batch=self._batch, group=layers[1],
+        )
+        self._readout_texts = [
+            arcade.Text("", left + 10, 0, arcade.color.WHITE, 10, batch=self._batch, group=layers[1])
+            for _ in self.READOUTS
+        ]
+        self._readouts: Tuple[Optional[str], ...] = ()
+        self._condition = None
+        self._dirty = True
+        self._layout_y = None
+
     def set_weather(self, weather_data: Optional[Dict[str, float]]):
         """Update weather data"""
         self.weather_data = weather_data
+        if not weather_data:
+            return
+
+        # Raw readings change every frame; re-layout only when the shown strings do
+        readouts = tuple(
+            fmt.format(weather_data[key]) if key in weather_data else None
+            for key, fmt in self.READOUTS
+        )
+        condition = (weather_data.get("weather"), weather_data.get("is_night"))
+        if readouts != self._readouts or condition != self._condition:
+            self._readouts = readouts
+            self._condition = condition
+            self._dirty = True
         #if weather_data:
             #print(f"Weather: {weather_data.get('weather', 'Unknown')} (rainfall: {weather_data.get('rainfall', 0)}, humidity: {weather_data.get('humidity', 0)})")
 
+    def _layout(self, y: float):
+        """Rewrite and stack the readouts; only runs when the data or window height changed"""
+        self._panel.y = y - 120
+        _place_text(self._header_text, self.left + 10, y)
+
+        y -= 25
+        for readout, text in zip(self._readouts, self._readout_texts):
+            text.visible = readout is not None
+            if text.visible:
+                text.text = readout
+                _place_text(text, self.left + 10, y)
+                y -= 18
+
+        self._dirty = False
+
     def draw(self, window):
         """Draw weather panel"""
         if not self.visible or not self.weather_data:
@@ -244,14 +375,11 @@ class WeatherComponent(BaseComponent):
 
         y = window.height - self.top_offset
 
-        # Draw background using Arcade 3.0+ syntax
-        weather_rect = arcade.rect.XYWH(self.left + 100, y - 60, 200, 120)
-        arcade.draw_rect_filled(weather_rect, (40, 40, 45, 200))
-
-        # Draw header
-        arcade.draw_text(
-            "WEATHER", self.left + 10, y, arcade.color.WHITE, 12, bold=True
-        )
+        # Draw background, header and readouts
+        if self._dirty or y != self._layout_y:
+            self._layout(y)
+            self._layout_y = y
+        self._batch.draw()
 
         # Enhanced weather icon rendering with night support
         icon_x = self.left + 150
@@ -465,48 +593,6 @@ class WeatherComponent(BaseComponent):
             # Default fallback - simple weather icon
             arcade.draw_circle_filled(icon_x, icon_y, icon_size // 2, (200, 200, 200))
 
-        y -= 25
-
-        # Draw weather info
-        if "air_temp" in self.weather_data:
-            arcade.draw_text(
-                f"Air: {self.weather_data['air_temp']:.1f}°C",
-                self.left + 10,
-                y,
-                arcade.color.WHITE,
-                10,
-            )
-            y -= 18
-
-        if "track_temp" in self.weather_data:
-            arcade.draw_text(
-                f"Track: {self.weather_data['track_temp']:.1f}°C",
-                self.left + 10,
-                y,
-                arcade.color.WHITE,
-                10,
-            )
-            y -= 18
-
-        if "humidity" in self.weather_data:
-            arcade.draw_text(
-                f"Humidity: {self.weather_data['humidity']:.0f}%",
-                self.left + 10,
-                y,
-                arcade.color.WHITE,
-                10,
-            )
-            y -= 18
-
-        if "wind_speed" in self.weather_data:
-            arcade.draw_text(
-                f"Wind: {self.weather_data['wind_speed']:.1f} km/h",
-                self.left + 10,
-                y,
-                arcade.color.WHITE,
-                10,
-            )
-
 
 class RaceProgressBarComponent(BaseComponent):
     # Event type constants (Same as before)
@@ -516,6 +602,15 @@ class RaceProgressBarComponent(BaseComponent):
     EVENT_RED_FLAG = "red"
     EVENT_VSC = "vsc"
 
+    # Marker colours along the bar (RGBA)
+    EVENT_COLORS = {
+        EVENT_DNF: (200, 200, 200, 255),
+        EVENT_YELLOW_FLAG: (255, 255, 0, 255),
+        EVENT_SAFETY_CAR: (255, 165, 0, 255),
+        EVENT_RED_FLAG: (255, 0, 0, 255),
+        EVENT_VSC: (255, 215, 0, 255),
+    }
+
     def __init__(
         self,
         x: float = 30,      # Fixed X position (Left side)
@@ -527,14 +622,68 @@ class RaceProgressBarComponent(BaseComponent):
         self.visible = visible
         self.progress = 0.0
         self.events = []
+
+        # Event marker geometry, cached by set_events
+        self._event_pos = np.empty(0, dtype=np.float32)
+        self._event_colors = np.empty((0, 4), dtype=np.uint8)
+        self._event_lines = []
         
         # Dimensions calculated in on_resize
         self.height = 0
         self.center_y = 0
 
-    def set_events(self, events: List[Dict[str, Any]]):
+        # Track, fill, event ticks and marker share one batch; the fill and marker move every frame
+        self._batch = pyglet.graphics.Batch()
+        self._layers = layers = _ordered_groups(5)
+        left = x - (width / 2)
+        self._track = pyglet.shapes.Rectangle(
+            left, 0, width, 0, (40, 40, 45), batch=self._batch, group=layers[0]
+        )
+        self._track_outline = pyglet.shapes.Box(
+            left - 0.5, -0.5, width + 1, 1, thickness=1, color=(100, 100, 100),
+            batch=self._batch, group=layers[1],
+        )
+        self._fill = pyglet.shapes.Rectangle(
+            left, 0, width, 0, (225, 6, 0), batch=self._batch, group=layers[2]  # F1 Red
+        )
+        # Current position marker, pointing right; .y follows the progress
+        self._marker = pyglet.shapes.Triangle(
+            x + (width / 2) + 2, 0,   # Tip (Right)
+            left - 4, 5,              # Top-Left
+            left - 4, -5,             # Bottom-Left
+            arcade.color.WHITE, batch=self._batch, group=layers[4],
+        )
+
+    def set_events(self, events: List[Dict[str, Any]], total_frames: int):
         self.events = events
 
+        # Bar-relative positions (0 = start, 1 = finish) and colours, computed once
+        self._event_pos = np.asarray([e["frame"] for e in events], dtype=np.float32)
+        self._event_pos /= max(total_frames, 1)
+        np.clip(self._event_pos, 0.0, 1.0, out=self._event_pos)
+
+        self._event_colors = np.empty((len(events), 4), dtype=np.uint8)
+        for i, event in enumerate(events):
+            self._event_colors[i] = self.EVENT_COLORS.get(event["type"], (255, 255, 255, 255))
+
+        left = self.x - (self.width / 2)
+        self._event_lines = [
+            pyglet.shapes.Line(
+                left, 0, left + self.width, 0, thickness=2, color=color,
+                batch=self._batch, group=self._layers[3],
+            )
+            for color in map(tuple, self._event_colors.tolist())
+        ]
+        self._place_event_markers()
+
+    def _place_event_markers(self):
+        """Move the event ticks to their positions along the current bar height"""
+        bottom_y = self.center_y - (self.height / 2)
+        marker_ys = bottom_y + self._event_pos * self.height
+        for line, y in zip(self._event_lines, marker_ys.tolist()):
+            line.y = y
+            line.y2 = y
+
     def set_progress(self, progress: float):
         self.progress = max(0.0, min(1.0, progress))
 
@@ -544,34 +693,27 @@ class RaceProgressBarComponent(BaseComponent):
         self.height = window.height - (vertical_padding * 2)
         self.center_y = window.height / 2
 
+        bottom_y = self.center_y - (self.height / 2)
+        self._track.y = bottom_y
+        self._track.height = self.height
+        self._track_outline.y = bottom_y - 0.5
+        self._track_outline.height = self.height + 1
+        self._fill.y = bottom_y
+        self._place_event_markers()
+
     def draw(self, window):
         if not self.visible:
             return
 
         # Calculate coordinates
         bottom_y = self.center_y - (self.height / 2)
-        
-        # 1. Draw Background Track (Vertical)
-        bg_rect = arcade.rect.XYWH(self.x, self.center_y, self.width, self.height)
-        arcade.draw_rect_filled(bg_rect, (40, 40, 45))
-        arcade.draw_rect_outline(bg_rect, (100, 100, 100), 1)
 
-        # 2. Draw Progress Fill (Growing Upwards)
+        # Progress fill grows upwards; the marker sits on top of it
         fill_height = self.height * self.progress
-        if fill_height > 0:
-            # Center of the fill rect must be calculated carefully
-            fill_center_y = bottom_y + (fill_height / 2)
-            fill_rect = arcade.rect.XYWH(self.x, fill_center_y, self.width, fill_height)
-            arcade.draw_rect_filled(fill_rect, (225, 6, 0)) # F1 Red
-
-        # 3. Draw Current Position Marker (Triangle pointing Right)
-        marker_y = bottom_y + fill_height
-        arcade.draw_triangle_filled(
-            self.x + (self.width / 2) + 2, marker_y,       # Tip (Right)
-            self.x - (self.width / 2) - 4, marker_y + 5,   # Top-Left
-            self.x - (self.width / 2) - 4, marker_y - 5,   # Bottom-Left
-            arcade.color.WHITE
-        )
+        _update_shape(self._fill, visible=fill_height > 0, height=fill_height)
+        _update_shape(self._marker, y=bottom_y + fill_height)
+
+        self._batch.draw()
 
 
 class DriverInfoComponent(BaseComponent):
@@ -582,6 +724,80 @@ class DriverInfoComponent(BaseComponent):
         self.visible = False
         self.driver_names = driver_names or {}
 
+        # Panel, gear box, pedal bars and labels share one batch; only the bar
+        # fills and the name/speed/gear values change per frame
+        self._batch = pyglet.graphics.Batch()
+        layers = _ordered_groups(5)
+        self._panel = pyglet.shapes.Rectangle(
+            left, 0, width, 240, (40, 40, 45, 230), batch=self._batch, group=layers[0]
+        )
+        self._panel_outline = pyglet.shapes.Box(
+            left - 0.5, 0, width + 1, 241, thickness=1, color=(255, 255, 255, 30),
+            batch=self._batch, group=layers[1],
+        )
+        self._gear_box = pyglet.shapes.Box(
+            left + width - 56, 0, 32, 32, thickness=2, color=arcade.color.WHITE,
+            batch=self._batch, group=layers[1],
+        )
+        self._pedal_bars = {}
+        for name, bar_x, fill_color in (("throttle", 30, (0, 255, 0)), ("brake", -30, (255, 0, 0))):
+            bar_left = left + (width / 2) + bar_x - 20
+            self._pedal_bars[name] = (
+                pyglet.shapes.Rectangle(
+                    bar_left, 0, 40, 80, (20, 20, 20), batch=self._batch, group=layers[1]
+                ),
+                pyglet.shapes.Box(
+                    bar_left - 0.5, 0, 41, 81, thickness=1, color=(100, 100, 100),
+                    batch=self._batch, group=layers[2],
+                ),
+                pyglet.shapes.Rectangle(
+                    bar_left + 2, 0, 36, 0, fill_color, batch=self._batch, group=layers[3]
+                ),
+            )
+
+        labels = {"batch": self._batch, "group": layers[4]}
+        gear_x = left + width - 40
+        center_x = left + (width / 2)
+        self._name_text = arcade.Text("", left + 20, 0, arcade.color.WHITE, 17, bold=True, **labels)
+        self._speed_text = arcade.Text("", left + 20, 0, arcade.color.WHITE, 27, bold=True, **labels)
+        self._kmh_text = arcade.Text("km/h", left + 95, 0, arcade.color.GRAY, 16, **labels)
+        self._gear_text = arcade.Text(
+            "", gear_x, 0, arcade.color.CYAN, 20,
+            bold=True, anchor_x="center", anchor_y="center", **labels,
+        )
+        self._gear_label = arcade.Text(
+            "GEAR", gear_x, 0, arcade.color.GRAY, 9, anchor_x="center", bold=True, **labels
+        )
+        self._pedal_labels = (
+            arcade.Text("THR", center_x + 30, 0, arcade.color.GRAY, 10, anchor_x="center", **labels),
+            arcade.Text("BRK", center_x - 30, 0, arcade.color.GRAY, 10, anchor_x="center", **labels),
+        )
+        self._layout_height = None
+
+    def _layout(self, panel_center_y: float):
+        """Move the static panel shapes after a change in window height"""
+        panel_bottom_y = panel_center_y - 120
+        bars_bottom_y = panel_bottom_y + 20
+        self._panel.y = panel_bottom_y
+        self._panel_outline.y = panel_bottom_y - 0.5
+        # Name row at top - 35, speed row 45 below it; the gear box sits 15px above the speed row
+        name_y = panel_center_y + 120 - 35
+        speed_y = name_y - 45
+        gear_box_y = speed_y + 15
+        self._gear_box.y = gear_box_y - 16
+        for background, outline, fill in self._pedal_bars.values():
+            background.y = bars_bottom_y
+            outline.y = bars_bottom_y - 0.5
+            fill.y = bars_bottom_y
+
+        self._name_text.y = name_y
+        self._speed_text.y = speed_y
+        self._kmh_text.y = speed_y
+        self._gear_text.y = gear_box_y
+        self._gear_label.y = gear_box_y - 32
+        for label in self._pedal_labels:
+            label.y = bars_bottom_y - 12
+
     def set_driver_data(self, driver_data: Optional[Dict[str, Any]]):
         self.driver_data = driver_data
         self.visible = driver_data is not None
@@ -590,84 +806,58 @@ class DriverInfoComponent(BaseComponent):
         if not self.visible or not self.driver_data:
             return
 
-        # 1. Calculate Panel Coordinates
-        panel_center_y = window.height / 2
-        panel_height = 240
-        center_x = self.left + (self.width / 2)
-        
-        # Background
-        panel_rect = arcade.rect.XYWH(center_x, panel_center_y, self.width, panel_height)
-        arcade.draw_rect_filled(panel_rect, (40, 40, 45, 230))
-        arcade.draw_rect_outline(panel_rect, (255, 255, 255, 30), 1)
+        # 1. Move the panel and labels only when the window height changed
+        if window.height != self._layout_height:
+            self._layout(window.height / 2)
+            self._layout_height = window.height
 
         # ---------------------------------------------------------
-        # TOP SECTION: Text Info
+        # TOP SECTION: Text Info (Text setters skip unchanged values)
         # ---------------------------------------------------------
-        current_y = panel_center_y + (panel_height / 2) - 35
-        
         # --- DRIVER NAME ---
         driver_code = self.driver_data.get("driver", "???")
-        full_name = self.driver_names.get(driver_code, driver_code)
-        
-        font_size = 17
-        arcade.draw_text(full_name, self.left + 20, current_y, arcade.color.WHITE, font_size, bold=True)
-
-        current_y -= 45
+        self._name_text.text = self.driver_names.get(driver_code, driver_code)
 
         # --- SPEED ---
         speed = int(self.driver_data.get("speed", 0))
-        arcade.draw_text(f"{speed}", self.left + 20, current_y, arcade.color.WHITE, 27, bold=True)
-        arcade.draw_text("km/h", self.left + 95, current_y, arcade.color.GRAY, 16)
-        
+        self._speed_text.text = f"{speed}"
+
         # --- GEAR ---
         gear = self.driver_data.get("gear", 0)
-        gear_str = str(gear) if gear > 0 else "N"
-        
-        gear_x = self.left + self.width - 40
-        gear_box_y = current_y + 15
-        
-        arcade.draw_rect_outline(arcade.rect.XYWH(gear_x, gear_box_y, 30, 30), arcade.color.WHITE, 2)
-        arcade.draw_text(gear_str, gear_x, gear_box_y, arcade.color.CYAN, 20, bold=True, anchor_x="center", anchor_y="center")
-        arcade.draw_text("GEAR", gear_x, gear_box_y - 32, arcade.color.GRAY, 9, anchor_x="center", bold=True)
+        self._gear_text.text = str(gear) if gear > 0 else "N"
 
         # ---------------------------------------------------------
         # BOTTOM SECTION: Animated Pedals
         # ---------------------------------------------------------
-        bar_width = 40
         max_bar_height = 80
-        bars_bottom_y = panel_center_y - (panel_height / 2) + 20
-        
+
         throttle = self.driver_data.get("throttle", 0)
         brake = self.driver_data.get("brake", 0)
 
         # --- THROTTLE (Green) ---
-        thr_x = center_x + 30
-        arcade.draw_rect_filled(arcade.rect.XYWH(thr_x, bars_bottom_y + max_bar_height/2, bar_width, max_bar_height), (20, 20, 20))
-        arcade.draw_rect_outline(arcade.rect.XYWH(thr_x, bars_bottom_y + max_bar_height/2, bar_width, max_bar_height), (100, 100, 100), 1)
-        
         thr_height = (throttle / 100) * max_bar_height
-        if thr_height > 0:
-            arcade.draw_rect_filled(arcade.rect.XYWH(thr_x, bars_bottom_y + thr_height/2, bar_width - 4, thr_height), (0, 255, 0))
-        arcade.draw_text("THR", thr_x, bars_bottom_y - 12, arcade.color.GRAY, 10, anchor_x="center")
+        _update_shape(self._pedal_bars["throttle"][2], visible=thr_height > 0, height=thr_height)
 
         # --- BRAKE (Red - Binary/Full) ---
-        brk_x = center_x - 30
-        arcade.draw_rect_filled(arcade.rect.XYWH(brk_x, bars_bottom_y + max_bar_height/2, bar_width, max_bar_height), (20, 20, 20))
-        arcade.draw_rect_outline(arcade.rect.XYWH(brk_x, bars_bottom_y + max_bar_height/2, bar_width, max_bar_height), (100, 100, 100), 1)
-        
         # LOGIC FIX: Check against 0.1 instead of 1
         # This catches boolean True (1.0) AND percentage pressure (>1%)
-        if brake > 0.1: 
-            brk_height = max_bar_height
-            arcade.draw_rect_filled(
-                arcade.rect.XYWH(brk_x, bars_bottom_y + brk_height/2, bar_width - 4, brk_height), 
-                (255, 0, 0)
-            )
-            
-        arcade.draw_text("BRK", brk_x, bars_bottom_y - 12, arcade.color.GRAY, 10, anchor_x="center")
+        _update_shape(self._pedal_bars["brake"][2], visible=brake > 0.1, height=max_bar_height)
+
+        # Panel, bars and labels in a single batch
+        self._batch.draw()
 
 
 class LegendComponent(BaseComponent):
+    LABELS = (
+        "SPACE: Pause/Resume",
+        "←/→: Rewind/Forward",
+        "↑/↓: Speed Up/Down",
+        "R: Restart",
+        "D: Toggle DRS Zones",
+        "L: Toggle Labels",
+        "H: Toggle Help",
+    )
+
     def __init__(self, visible: bool = True):
         # We drop the 'x' argument because position is now dynamic
         self.visible = visible
@@ -678,77 +868,146 @@ class LegendComponent(BaseComponent):
         self.x = 0
         self.y = 0
 
+        # The text never changes, so it is laid out once and only moved on resize.
+        # Shadows sit in the lower group so every label is drawn over them.
+        self._batch = pyglet.graphics.Batch()
+        layers = _ordered_groups(2)
+        self._header_text = arcade.Text(
+            "CONTROLS", 0, 0, arcade.color.CYAN, 12,
+            bold=True, batch=self._batch, group=layers[1],
+        )
+        self._label_texts = [
+            (
+                # Shadow for readability
+                arcade.Text(label, 0, 0, (0, 0, 0, 200), 10, batch=self._batch, group=layers[0]),
+                arcade.Text(label, 0, 0, arcade.color.WHITE, 10, batch=self._batch, group=layers[1]),
+            )
+            for label in self.LABELS
+        ]
+        self._layout()
+
+    def _layout(self):
+        bottom_left_x = self.x
+        current_y = self.y + self.height - 30
+
+        _place_text(self._header_text, bottom_left_x + 10, current_y)
+        current_y -= 25
+
+        for shadow, text in self._label_texts:
+            _place_text(shadow, bottom_left_x + 11, current_y - 1)
+            _place_text(text, bottom_left_x + 10, current_y)
+            current_y -= 16
+
     def on_resize(self, window):
         padding = 20  # Space from the edge of the window
         self.x = window.width - self.width - padding
         self.y = padding  # Start 20 pixels up from the bottom edge (y=0 in Arcade)
+        self._layout()
 
     def draw(self, window):
         if not self.visible:
             return
 
-        # Use the calculated self.x and self.y
-        bottom_left_x = self.x
-        current_y = self.y + self.height - 30
-
-        # Draw Header
-        arcade.draw_text(
-            "CONTROLS", bottom_left_x + 10, current_y, arcade.color.CYAN, 12, bold=True
-        )
-        current_y -= 25
-
-        # Draw list items
-        labels = [
-            "SPACE: Pause/Resume",
-            "←/→: Rewind/Forward",
-            "↑/↓: Speed Up/Down",
-            "R: Restart",
-            "D: Toggle DRS Zones",
-            "L: Toggle Labels",
-            "H: Toggle Help"
-        ]
-
-        for label in labels:
-            # Draw shadow for readability
-            arcade.draw_text(label, bottom_left_x + 11, current_y - 1, (0, 0, 0, 200), 10)
-            # Draw actual text
-            arcade.draw_text(label, bottom_left_x + 10, current_y, arcade.color.WHITE, 10)
-            current_y -= 16
+        self._batch.draw()
 
 
 class SessionInfoComponent(BaseComponent):
     def __init__(self, session_info: Optional[Dict[str, Any]] = None):
         self.session_info = session_info or {}
 
-    def draw(self, window):
-        if not self.session_info:
-            return
-
-        y = window.height - 20
-
         event_name = self.session_info.get("event_name", "")
         year = self.session_info.get("year", "")
 
-        info_text = f"{event_name} {year}"
-        arcade.draw_text(
-            info_text,
-            window.width / 2,
-            y,
-            arcade.color.WHITE,
-            14,
-            anchor_x="center",
-            bold=True,
+        # Fixed for the whole replay; only re-anchored when the window changes
+        self._info_text = arcade.Text(
+            f"{event_name} {year}", 0, 0, arcade.color.WHITE, 14,
+            anchor_x="center", bold=True,
         )
 
+    def draw(self, window):
+        if not self.session_info:
+            return
+
+        _place_text(self._info_text, window.width / 2, window.height - 20)
+        self._info_text.draw()
+
 
 # ============================================================================
 # TRACK RENDERING UTILITIES
 # ============================================================================
 
+# DRS channel values meaning the flap is open/available (10=available, 12/14=enabled)
+ACTIVE_DRS_STATES = np.array([10, 12, 14])
+
+
+@dataclass
+class TrackGeometry:
+    """Track outline as contiguous float32 (N, 2) point arrays, ready for upload"""
+
+    ref_xy: np.ndarray
+    inner_xy: np.ndarray
+    outer_xy: np.ndarray
+    bounds: np.ndarray  # x_min, x_max, y_min, y_max
+    drs_zones: List[Dict[str, Any]]
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _track_edges(ref_xy, half_width):
+        n = ref_xy.shape[0]
+        inner_xy = np.empty((n, 2), np.float32)
+        outer_xy = np.empty((n, 2), np.float32)
+        for i in range(n):
+            # Central differences inside, one-sided at the ends (as np.gradient)
+            lo = max(i - 1, 0)
+            hi = min(i + 1, n - 1)
+            step = hi - lo
+            dx = (ref_xy[hi, 0] - ref_xy[lo, 0]) / step
+            dy = (ref_xy[hi, 1] - ref_xy[lo, 1]) / step
+            norm = np.sqrt(dx * dx + dy * dy)
+            if norm == 0.0:
+                norm = 1.0
+            nx = -(dy / norm) * half_width
+            ny = (dx / norm) * half_width
+            outer_xy[i, 0] = ref_xy[i, 0] + nx
+            outer_xy[i, 1] = ref_xy[i, 1] + ny
+            inner_xy[i, 0] = ref_xy[i, 0] - nx
+            inner_xy[i, 1] = ref_xy[i, 1] - ny
+        return inner_xy, outer_xy
+
+
+def _compute_track_edges(ref_xy, half_width):
+    """Inner/outer edges offset half_width along the normals of the reference line.
+
+    Uses the fused numba kernel (one pass, no temporaries) when numba is
+    installed.
+    """
+    if njit is not None:
+        return _track_edges(ref_xy, half_width)
+
+    # Compute tangents: central differences inside, one-sided at the ends
+    # (what np.gradient does, without its generic n-d machinery)
+    tangent = np.empty_like(ref_xy)
+    tangent[1:-1] = (ref_xy[2:] - ref_xy[:-2]) / 2
+    tangent[0] = ref_xy[1] - ref_xy[0]
+    tangent[-1] = ref_xy[-1] - ref_xy[-2]
+
+    norm = np.sqrt((tangent**2).sum(axis=1))
+    norm[norm == 0] = 1.0  # Avoid division by zero
+    tangent /= norm[:, None]
+
+    # Normals, scaled to half the track width
+    normal = np.empty_like(tangent)
+    normal[:, 0] = -tangent[:, 1] * half_width
+    normal[:, 1] = tangent[:, 0] * half_width
+
+    return ref_xy - normal, ref_xy + normal
+
 
 def build_track_from_example_lap(
     example_lap, track_width: float = DEFAULT_TRACK_WIDTH
-) -> Tuple:
+) -> TrackGeometry:
     # Validation 1: Check if example_lap exists
     if example_lap is None:
         raise ValueError("example_lap cannot be None")
@@ -776,61 +1035,36 @@ def build_track_from_example_lap(
         print(f"⚠️ Warning: Could not extract DRS zones: {e}")
         drs_zones = []
 
-    plot_x_ref = example_lap["X"]
-    plot_y_ref = example_lap["Y"]
+    # Reference line as one contiguous float32 (N, 2) array
+    ref_xy = np.ascontiguousarray(example_lap[["X", "Y"]].to_numpy(dtype=np.float32))
 
     # Validation 5: Check for NaN or infinite values
-    if plot_x_ref.isna().any() or plot_y_ref.isna().any():
+    invalid = np.isnan(ref_xy).any(axis=1)
+    if invalid.any():
         print("⚠️ Warning: NaN values found in coordinates, removing...")
-        valid_mask = ~(plot_x_ref.isna() | plot_y_ref.isna())
-        plot_x_ref = plot_x_ref[valid_mask]
-        plot_y_ref = plot_y_ref[valid_mask]
+        ref_xy = ref_xy[~invalid]
 
-        if len(plot_x_ref) < 10:
+        if len(ref_xy) < 10:
             raise ValueError("Too many invalid coordinates")
 
-    # Compute tangents
-    dx = np.gradient(plot_x_ref)
-    dy = np.gradient(plot_y_ref)
-
-    norm = np.sqrt(dx**2 + dy**2)
-    norm[norm == 0] = 1.0  # Avoid division by zero
-    dx /= norm
-    dy /= norm
-
-    # Compute normals
-    nx = -dy
-    ny = dx
-
     # Calculate track edges
-    half_width = track_width / 2
-    x_outer = plot_x_ref + nx * half_width
-    y_outer = plot_y_ref + ny * half_width
-    x_inner = plot_x_ref - nx * half_width
-    y_inner = plot_y_ref - ny * half_width
+    inner_xy, outer_xy = _compute_track_edges(ref_xy, float(track_width) / 2)
 
     # World bounds
-    x_min = min(plot_x_ref.min(), x_inner.min(), x_outer.min())
-    x_max = max(plot_x_ref.max(), x_inner.max(), x_outer.max())
-    y_min = min(plot_y_ref.min(), y_inner.min(), y_outer.min())
-    y_max = max(plot_y_ref.max(), y_inner.max(), y_outer.max())
+    all_xy = np.concatenate((ref_xy, inner_xy, outer_xy))
+    x_min, y_min = all_xy.min(axis=0)
+    x_max, y_max = all_xy.max(axis=0)
 
     # Validation 6: Check for valid bounds
     if x_min == x_max or y_min == y_max:
         raise ValueError("Track has zero width or height")
 
-    return (
-        plot_x_ref,
-        plot_y_ref,
-        x_inner,
-        y_inner,
-        x_outer,
-        y_outer,
-        x_min,
-        x_max,
-        y_min,
-        y_max,
-        drs_zones,
+    return TrackGeometry(
+        ref_xy=ref_xy,
+        inner_xy=inner_xy,
+        outer_xy=outer_xy,
+        bounds=np.array([x_min, x_max, y_min, y_max], dtype=np.float32),
+        drs_zones=drs_zones,
     )
 
 
@@ -845,63 +1079,26 @@ def plot_drs_zones(example_lap) -> List[Dict[str, Any]]:
         print("⚠️ Warning: Missing X or Y coordinates for DRS zones")
         return []
 
-    x_val = example_lap["X"]
-    y_val = example_lap["Y"]
-    drs_data = example_lap["DRS"]
+    x_val = example_lap["X"].to_numpy(dtype=float)
+    y_val = example_lap["Y"].to_numpy(dtype=float)
+    drs_data = example_lap["DRS"].to_numpy()
 
-    drs_zones = []
-    drs_start = None
+    # Rising/falling edges of the DRS active states
+    active = np.isin(drs_data, ACTIVE_DRS_STATES).astype(np.int8)
+    edges = np.diff(active, prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
 
-    try:
-        for i, val in enumerate(drs_data):
-            # Check for DRS active states (10=available, 12=enabled, 14=enabled)
-            if val in [10, 12, 14]:
-                if drs_start is None:
-                    drs_start = i
-            else:
-                if drs_start is not None:
-                    drs_end = i - 1
-
-                    # Validation: Check indices are valid
-                    if drs_start < len(x_val) and drs_end < len(x_val):
-                        zone = {
-                            "start": {
-                                "x": float(x_val.iloc[drs_start]),
-                                "y": float(y_val.iloc[drs_start]),
-                                "index": drs_start,
-                            },
-                            "end": {
-                                "x": float(x_val.iloc[drs_end]),
-                                "y": float(y_val.iloc[drs_end]),
-                                "index": drs_end,
-                            },
-                        }
-                        drs_zones.append(zone)
-
-                    drs_start = None
-
-        # Handle DRS zone extending to end of lap
-        if drs_start is not None:
-            drs_end = len(drs_data) - 1
-
-            if drs_start < len(x_val) and drs_end < len(x_val):
-                zone = {
-                    "start": {
-                        "x": float(x_val.iloc[drs_start]),
-                        "y": float(y_val.iloc[drs_start]),
-                        "index": drs_start,
-                    },
-                    "end": {
-                        "x": float(x_val.iloc[drs_end]),
-                        "y": float(y_val.iloc[drs_end]),
-                        "index": drs_end,
-                    },
-                }
-                drs_zones.append(zone)
-
-    except Exception as e:
-        print(f"⚠️ Warning: Error extracting DRS zones: {e}")
-        return []
+    drs_zones = [
+        {
+            "start": {"x": sx, "y": sy, "index": si},
+            "end": {"x": ex, "y": ey, "index": ei},
+        }
+        for si, sx, sy, ei, ex, ey in zip(
+            starts.tolist(), x_val[starts].tolist(), y_val[starts].tolist(),
+            ends.tolist(), x_val[ends].tolist(), y_val[ends].tolist(),
+        )
+    ]
 
     if drs_zones:
         print(f"✓ Found {len(drs_zones)} DRS zone(s)")
@@ -917,26 +1114,28 @@ def extract_race_events(
     if not frames:
         return events
 
-    # Sample frames for DNF detection
+    # Sample frames for DNF detection: a driver present in one sample and
+    # missing from the next one has dropped out
     sample_rate = 25
-    prev_drivers = set()
-
-    for i in range(0, len(frames), sample_rate):
-        frame = frames[i]
-        current_drivers = set(frame.get("drivers", {}).keys())
-
-        if prev_drivers:
-            dnf_drivers = prev_drivers - current_drivers
-            for driver_code in dnf_drivers:
-                events.append(
-                    {
-                        "type": RaceProgressBarComponent.EVENT_DNF,
-                        "frame": i,
-                        "label": driver_code,
-                    }
-                )
-
-        prev_drivers = current_drivers
+    sampled = [
+        frames[i].get("drivers", {}) for i in range(0, len(frames), sample_rate)
+    ]
+    universe = sorted({code for drivers in sampled for code in drivers})
+    column = {code: j for j, code in enumerate(universe)}
+
+    present = np.zeros((len(sampled), len(universe)), dtype=bool)
+    for row, drivers in enumerate(sampled):
+        present[row, [column[code] for code in drivers]] = True
+
+    dropped_rows, dropped_cols = np.nonzero(present[:-1] & ~present[1:])
+    for row, col in zip(dropped_rows.tolist(), dropped_cols.tolist()):
+        events.append(
+            {
+                "type": RaceProgressBarComponent.EVENT_DNF,
+                "frame": (row + 1) * sample_rate,
+                "label": universe[col],
+            }
+        )
 
     # Add flag events
     for status in track_statuses:
@@ -1076,23 +1275,12 @@ class F1RaceReplayWindow(arcade.Window):
 
         # Extract and set events
         events = extract_race_events(frames, track_statuses, total_laps or 0)
-        self.progress_bar_comp.set_events(events)
+        self.progress_bar_comp.set_events(events, self.n_frames)
 
         # Build track
-        track_data = build_track_from_example_lap(example_lap, track_width=350.0)
-        (
-            self.plot_x_ref,
-            self.plot_y_ref,
-            self.x_inner,
-            self.y_inner,
-            self.x_outer,
-            self.y_outer,
-            self.x_min,
-            self.x_max,
-            self.y_min,
-            self.y_max,
-            self.drs_zones,
-        ) = track_data
+        self.track = build_track_from_example_lap(example_lap, track_width=350.0)
+        self.x_min, self.x_max, self.y_min, self.y_max = self.track.bounds.tolist()
+        self.drs_zones = self.track.drs_zones
 
         self.track_center_x = (self.x_min + self.x_max) / 2
         self.track_center_y = (self.y_min + self.y_max) / 2
@@ -1197,6 +1385,15 @@ class F1RaceReplayWindow(arcade.Window):
 
         return sx, sy
 
+    def _world_to_screen_xy(self, xy: np.ndarray) -> np.ndarray:
+        """Vectorised _world_to_screen for an (N, 2) array of world points"""
+        t = xy - np.array([self.track_center_x, self.track_center_y])
+        rx = t[:, 0] * self._cos_rot - t[:, 1] * self._sin_rot
+        ry = t[:, 0] * self._sin_rot + t[:, 1] * self._cos_rot
+        return np.column_stack(
+            (rx * self.track_scale + self.offset_x, ry * self.track_scale + self.offset_y)
+        )
+
     def on_draw(self):
         self.clear()
         
@@ -1238,18 +1435,15 @@ class F1RaceReplayWindow(arcade.Window):
 
     def _draw_track(self):
         # 1. Draw the Center Line 
-        center_points = [
-            self._world_to_screen(x, y)
-            for x, y in zip(self.plot_x_ref, self.plot_y_ref)
-        ]
+        center_points = self._world_to_screen_xy(self.track.ref_xy).tolist()
         if len(center_points) > 1:
             arcade.draw_line_strip(center_points, (255, 255, 255, 100), 1)
 
         
-        def draw_curbs(x_coords, y_coords):
+        def draw_curbs(edge_xy):
             segment_length = 4 
             
-            points = [self._world_to_screen(x, y) for x, y in zip(x_coords, y_coords)]
+            points = self._world_to_screen_xy(edge_xy).tolist()
             total_points = len(points)
 
             if total_points < 2:
@@ -1273,14 +1467,12 @@ class F1RaceReplayWindow(arcade.Window):
         # ---------------------------------------------------------
         # 2. Draw Inner and Outer Curbs using the helper
         # ---------------------------------------------------------
-        draw_curbs(self.x_inner, self.y_inner)
-        draw_curbs(self.x_outer, self.y_outer)
+        draw_curbs(self.track.inner_xy)
+        draw_curbs(self.track.outer_xy)
 
         # 3. Draw start/finish line (unchanged)
-        if len(self.plot_x_ref) > 0:
-            start_x, start_y = self._world_to_screen(
-                self.plot_x_ref.iloc[0], self.plot_y_ref.iloc[0]
-            )
+        if center_points:
+            start_x, start_y = center_points[0]
             arcade.draw_circle_filled(start_x, start_y, 8, (255, 255, 255))
             arcade.draw_circle_filled(start_x, start_y, 6, (0, 0, 0))
 
@@ -1290,17 +1482,10 @@ class F1RaceReplayWindow(arcade.Window):
             start_idx = zone["start"]["index"]
             end_idx = zone["end"]["index"]
 
-            # 2. Collect all screen coordinates for points inside this zone
-            drs_points = []
-            
-            for i in range(start_idx, end_idx + 1):
-                # Get the world X, Y from the stored reference lap
-                wx = self.plot_x_ref.iloc[i]
-                wy = self.plot_y_ref.iloc[i]
-                
-                # Convert to screen coordinates
-                sx, sy = self._world_to_screen(wx, wy)
-                drs_points.append((sx, sy))
+            # 2. Screen coordinates for the reference lap points inside this zone
+            drs_points = self._world_to_screen_xy(
+                self.track.ref_xy[start_idx:end_idx + 1]
+            ).tolist()
 
             # Draw DRS zone
             if drs_points:
@@ -1578,7 +1763,7 @@ def run_vision_module(
                 try:
                     drv = session.get_driver(driver_id)
                     driver_names[drv['Abbreviation']] = drv['FullName']
-                except:
+                except (KeyError, IndexError, ValueError):
                     pass
 
         # Create and run window
@@ -1633,8 +1818,9 @@ if __name__ == "__main__":
         help="Session type (R=Race, Q=Qualifying, S=Sprint, SQ=Sprint Qualifying)",
     )
     parser.add_argument("--ready-file", type=str, help="File to signal readiness")
+    parser.add_argument("--serve", action="store_true", help="Wait for the arguments as a JSON list on stdin")
 
-    args = parser.parse_args()
+    args = parser.parse_args(serve_argv())
 
     # Initialize
     enable_cache()